@@ -4,6 +4,8 @@ This example shows how users can register their own custom functions
 to extend DRLang's capabilities for domain-specific use cases.
 """
 
+import math
+
 from drlang import interpret, DRLConfig, register_function
 
 
@@ -21,10 +23,13 @@ print(f"Example 1: {data['temperature']}°C = {result}°F")
 
 
 # Example 2: Multiple custom functions for business logic
+DISCOUNTS = {"bronze": 0.05, "silver": 0.10, "gold": 0.15, "platinum": 0.20}
+SHIPPING_RATES = {"local": 5, "regional": 10, "national": 15, "international": 25}
+
+
 def calculate_discount(price, customer_tier):
     """Calculate discount based on customer tier."""
-    discounts = {"bronze": 0.05, "silver": 0.10, "gold": 0.15, "platinum": 0.20}
-    return price * discounts.get(customer_tier, 0)
+    return price * DISCOUNTS.get(customer_tier, 0)
 
 
 def apply_tax(amount, tax_rate):
@@ -34,8 +39,7 @@ def apply_tax(amount, tax_rate):
 
 def calculate_shipping(weight, zone):
     """Calculate shipping cost based on weight and zone."""
-    rates = {"local": 5, "regional": 10, "national": 15, "international": 25}
-    base_rate = rates.get(zone, 10)
+    base_rate = SHIPPING_RATES.get(zone, 10)
     return base_rate + (weight * 0.5)
 
 
@@ -111,8 +115,10 @@ print(f"\nExample 3: Age {user_data['age']} classified as: {result}")
 config = DRLConfig(
     custom_functions={
         "double": lambda x: x * 2,
-        "is_even": lambda n: n % 2 == 0,
-        "clamp": lambda value, min_val, max_val: max(min_val, min(value, max_val)),
+        "is_even": lambda n: not n & 1,
+        "clamp": lambda value, lo, hi: (
+            lo if value < lo else hi if value > hi else value
+        ),
     }
 )
 
@@ -125,13 +131,12 @@ print(f"clamp(150, 0, 100) = {interpret('clamp(150, 0, 100)', {}, config)}")
 # Example 5: Register functions globally
 def factorial(n):
     """Calculate factorial."""
-    if n <= 1:
-        return 1
-    return n * factorial(n - 1)
+    return math.prod(range(2, n + 1))
 
 
-# Register globally (available to all interpretations without config)
-register_function("factorial", factorial)
+# Register globally (available to all interpretations without config).
+# factorial is pure, so results are cached for repeated arguments.
+register_function("factorial", factorial, pure=True)
 
 result = interpret("factorial(5)", {})
 print(f"\nExample 5: factorial(5) = {result}")
@@ -143,7 +148,14 @@ def word_count(text):
     return len(text.split())
 
 
-config = DRLConfig(custom_functions={"word_count": word_count})
+def word_counts(texts):
+    """Count words in each text of a list."""
+    return list(map(len, map(str.split, texts)))
+
+
+config = DRLConfig(
+    custom_functions={"word_count": word_count, "word_counts": word_counts}
+)
 
 data = {"message": "Hello world from DRLang"}
 
@@ -152,4 +164,8 @@ expr = 'if(word_count($message) > 3, "long message", "short message")'
 result = interpret(expr, data, config)
 print(f"\nExample 6: '{data['message']}' is a {result}")
 
+# For many texts, one call on the whole list avoids a DRL call per message
+data = {"messages": ["Hi there", "See you at noon", "Ok"]}
+print(f"word_counts($messages) = {interpret('word_counts($messages)', data, config)}")
+
 print("\n✓ All custom function examples completed successfully!")
@@ -4,7 +4,7 @@ This example shows how the drop_empty configuration option can be used
 to exclude None and empty string values from the resulting dictionary.
 """
 
-from drlang import interpolate_dict, DRLConfig
+from drlang import interpolate_dict, compile_dict, DRLConfig
 
 
 def demo_drop_empty_false():
@@ -131,8 +131,10 @@ def demo_api_response_cleaning():
     print("(Only present fields will be included)")
     print()
 
+    # Prepare the templates once and render them for each user
+    render = compile_dict(expressions, config)
     for user_context in users_data:
-        result = interpolate_dict(expressions, user_context, config)
+        result = render(user_context)
         print(f"User {result['id']}:")
         for key, value in result.items():
             if key != "id":
@@ -227,36 +227,33 @@ def demo_chaining():
     print("\nPipeline: double → filter > 10 → sum")
     print(f"  Original: {data['nums']}")
 
-    # Step 1: Double
+    # Each stage nests the previous one instead of storing it in the context;
+    # the nested calls run as a single loop without intermediate lists
     doubled = interpret('map("$item * 2", $nums)', data)
     print(f"  After map (double): {doubled}")
 
-    # Step 2: Filter
-    data["doubled"] = doubled
-    filtered = interpret('filter("$item > 10", $doubled)', data)
+    filtered = interpret('filter("$item > 10", map("$item * 2", $nums))', data)
     print(f"  After filter (> 10): {filtered}")
 
-    # Step 3: Sum
-    data["filtered"] = filtered
-    total = interpret('reduce("$acc + $item", $filtered)', data)
+    total = interpret(
+        'reduce("$acc + $item", filter("$item > 10", map("$item * 2", $nums)))', data
+    )
     print(f"  After reduce (sum): {total}")
 
     print("\nAnother example: even squares")
     data = {"nums": list(range(1, 11))}
     print(f"  Original: {data['nums']}")
 
-    # Get even numbers
     evens = interpret('filter("$item % 2 == 0", $nums)', data)
     print(f"  Filter even: {evens}")
 
-    # Square them
-    data["evens"] = evens
-    squares = interpret('map("$item * $item", $evens)', data)
+    squares = interpret('map("$item * $item", filter("$item % 2 == 0", $nums))', data)
     print(f"  Map to squares: {squares}")
 
-    # Sum
-    data["squares"] = squares
-    total = interpret('reduce("$acc + $item", $squares)', data)
+    total = interpret(
+        'reduce("$acc + $item", map("$item * $item", filter("$item % 2 == 0", $nums)))',
+        data,
+    )
     print(f"  Sum: {total}")
 
 
@@ -276,10 +273,13 @@ def demo_practical_examples():
     }
     print(f"  Users: {len(data['users'])} records")
 
-    # Get all names
-    from drlang.functions import map_list
+    # Pivot the records once so each field is a single lookup
+    from drlang.functions import columnar
+
+    columns = columnar(data["users"])
 
-    names = map_list("$item>name", data["users"], {})
+    # Get all names
+    names = columns["name"]
     print(f"  Names: {names}")
 
     # Filter high scorers
@@ -291,7 +291,7 @@ def demo_practical_examples():
     # Calculate average score
     from drlang.functions import reduce_list
 
-    scores = map_list("$item>score", data["users"], {})
+    scores = columns["score"]
     total_score = reduce_list("$acc + $item", scores, 0, {})
     avg_score = total_score / len(scores)
     print(f"  Average score: {avg_score:.2f}")
@@ -307,7 +307,8 @@ def demo_practical_examples():
     }
 
     # Extract titles
-    titles = map_list("$item>title", api_data["results"], {})
+    results = columnar(api_data["results"])
+    titles = results["title"]
     print(f"  Titles: {titles}")
 
     # Filter by price
@@ -315,7 +316,7 @@ def demo_practical_examples():
     print(f"  Affordable items (< $20): {[item['title'] for item in affordable]}")
 
     # Calculate total
-    prices = map_list("$item>price", api_data["results"], {})
+    prices = results["price"]
     total = reduce_list("$acc + $item", prices, 0, {})
     print(f"  Total price: ${total:.2f}")
 
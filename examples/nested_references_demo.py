@@ -7,7 +7,7 @@ inner references are resolved first and their values used in
 the outer reference path.
 """
 
-from drlang import interpret, interpolate, DRLConfig
+from drlang import interpret, interpolate, compile_dict, DRLConfig
 
 print("=" * 70)
 print("DRLang Nested Reference Demo")
@@ -29,9 +29,11 @@ context1 = {
 expression = "$(rocks>$(records>best_rock)>color)"
 print(f"Context: {context1}")
 print(f"Expression: {expression}")
-print(f"Resolution:")
-print(f"  1. $(records>best_rock) → 'mica'")
-print(f"  2. $(rocks>mica>color) → 'silver'")
+print(
+    "Resolution:\n"
+    "  1. $(records>best_rock) → 'mica'\n"
+    "  2. $(rocks>mica>color) → 'silver'"
+)
 result = interpret(expression, context1)
 print(f"Result: {result}")
 
@@ -69,10 +71,12 @@ context3 = {
 
 expression = "$(database>$(pointers>table_name)>$(pointers>row_id)>name)"
 print(f"Expression: {expression}")
-print(f"Resolution:")
-print(f"  1. $(pointers>table_name) → 'users_table'")
-print(f"  2. $(pointers>row_id) → 'row_10'")
-print(f"  3. $(database>users_table>row_10>name) → 'Jane'")
+print(
+    "Resolution:\n"
+    "  1. $(pointers>table_name) → 'users_table'\n"
+    "  2. $(pointers>row_id) → 'row_10'\n"
+    "  3. $(database>users_table>row_10>name) → 'Jane'"
+)
 result = interpret(expression, context3)
 print(f"Result: {result}")
 
@@ -90,11 +94,13 @@ context4 = {
 
 expression = "$(data>$(keys>$(keys>$(keys>k1)))>value)"
 print(f"Expression: {expression}")
-print(f"Resolution:")
-print(f"  1. $(keys>k1) → 'k2'")
-print(f"  2. $(keys>k2) → 'k3'")
-print(f"  3. $(keys>k3) → 'item1'")
-print(f"  4. $(data>item1>value) → 'found it!'")
+print(
+    "Resolution:\n"
+    "  1. $(keys>k1) → 'k2'\n"
+    "  2. $(keys>k2) → 'k3'\n"
+    "  3. $(keys>k3) → 'item1'\n"
+    "  4. $(data>item1>value) → 'found it!'"
+)
 result = interpret(expression, context4)
 print(f"Result: {result}")
 
@@ -149,11 +155,19 @@ context7 = {
     "environment": {"current": "prod"},
 }
 
-print(f"Current Environment: {context7['environment']['current']}")
-db_host = interpret("$(config>$(environment>current)>db_host)", context7)
-api_url = interpret("$(config>$(environment>current)>api_url)", context7)
-print(f"Database Host: {db_host}")
-print(f"API URL: {api_url}")
+# Compile both lookups once and render them together for every environment
+connection_for = compile_dict(
+    {
+        "db_host": "$(config>$(environment>current)>db_host)",
+        "api_url": "$(config>$(environment>current)>api_url)",
+    }
+)
+for environment in ("dev", "prod"):
+    context7["environment"]["current"] = environment
+    connection = connection_for(context7)
+    print(f"Current Environment: {environment}")
+    print(f"  Database Host: {connection['db_host']}")
+    print(f"  API URL: {connection['api_url']}")
 
 # Example 8: Using Custom Syntax
 print("\n8. Nested References with Custom Syntax (@.)")
@@ -1,6 +1,6 @@
 """Demonstration of reference behaviors: () required, [] optional, {} literal."""
 
-from drlang import interpret, DRLReferenceError
+from drlang import interpret, interpolate_dict, DRLReferenceError
 
 print("=" * 70)
 print("DRLang Reference Behavior Demo")
@@ -45,7 +45,8 @@ try:
     result = interpret("$(user>age)", data)
     print(f"$(user>age) = {result}")
 except DRLReferenceError as e:
-    print(f"$(user>age) → Error: {str(e).split(chr(10))[0]}")
+    message = str(e).partition("\n")[0]
+    print(f"$(user>age) → Error: {message}")
 
 # ============================================================================
 # LITERAL FALLBACK ${ref}
@@ -120,27 +121,22 @@ config_data = {
     "server": {"host": "localhost", "port": 8080},
 }
 
-# Build connection string with defaults
+# Build connection settings with defaults, all in one interpolate_dict call
 # Required: name, host, port (use () for validation)
 # Optional: ssl, timeout (use [] for safe access with defaults)
-expr = "$(app>name)"
-app_name = interpret(expr.strip(), config_data)
-print(f"  App name (required): {app_name}")
-
-# Port with default
-expr = "if($[server>port], $[server>port], 80)"
-port = interpret(expr, config_data)
-print(f"  Port (with default): {port}")
-
-# SSL with default
-expr = 'if($[server>ssl], "https", "http")'
-protocol = interpret(expr, config_data)
-print(f"  Protocol (with default): {protocol}")
-
-# Timeout with default
-expr = "if($[server>timeout], $[server>timeout], 30)"
-timeout = interpret(expr, config_data)
-print(f"  Timeout (with default): {timeout}")
+settings = interpolate_dict(
+    {
+        "app_name": "$(app>name)",
+        "port": "{%= if($[server>port], $[server>port], 80) %}",
+        "protocol": '{%= if($[server>ssl], "https", "http") %}',
+        "timeout": "{%= if($[server>timeout], $[server>timeout], 30) %}",
+    },
+    config_data,
+)
+print(f"  App name (required): {settings['app_name']}")
+print(f"  Port (with default): {settings['port']}")
+print(f"  Protocol (with default): {settings['protocol']}")
+print(f"  Timeout (with default): {settings['timeout']}")
 
 # ============================================================================
 # MIGRATION GUIDE
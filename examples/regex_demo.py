@@ -4,7 +4,7 @@ This example shows how to use regex functions for pattern matching,
 text extraction, and data validation.
 """
 
-from drlang import interpret
+from drlang import interpret, interpret_batch
 
 print("=" * 70)
 print("DRLang Regex Functions Demo")
@@ -141,17 +141,24 @@ users = [
     {"email": "charlie@example.org", "username": "charlie_x"},
 ]
 
-for user in users:
-    # Validate email
-    email_valid = interpret(r'regex_search("@.*\.", $email)', user)
-
-    # Validate username (alphanumeric and underscore only)
-    username_valid = interpret(r'regex_match("^\w+$", $username)', user)
-
-    # Overall validation
-    expr = 'if($valid_email and $valid_user, "VALID", "INVALID")'
-    status = interpret(expr, {"valid_email": email_valid, "valid_user": username_valid})
+# Each expression is parsed once and evaluated for every user
+# Validate email
+emails_valid = interpret_batch(r'regex_search("@.*\.", $email)', users)
+
+# Validate username (alphanumeric and underscore only)
+usernames_valid = interpret_batch(r'regex_match("^\w+$", $username)', users)
+
+# Overall validation
+expr = 'if($valid_email and $valid_user, "VALID", "INVALID")'
+statuses = interpret_batch(
+    expr,
+    [
+        {"valid_email": email_valid, "valid_user": username_valid}
+        for email_valid, username_valid in zip(emails_valid, usernames_valid)
+    ],
+)
 
+for user, status in zip(users, statuses):
     print(f"User: {user['username']:12} Email: {user['email']:25} Status: {status}")
 
 # Example 7: Password validation
@@ -159,15 +166,16 @@ print("\n7. Password Strength Validation")
 print("-" * 70)
 
 passwords = ["weak", "Better1", "Str0ng!Pass", "MyP@ssw0rd123"]
+# Upper, lower, digit, special
+requirements = ["[A-Z]", "[a-z]", r"\d", "[^a-zA-Z0-9]"]
 
-for pwd in passwords:
-    data = {"pwd": pwd}
+# Check all requirements for every password with one parsed expression
+checks = interpret_batch(
+    "regex_search_many($requirements, $pwd)",
+    [{"pwd": pwd, "requirements": requirements} for pwd in passwords],
+)
 
-    # Check various requirements
-    has_upper = interpret(r'regex_search("[A-Z]", $pwd)', data)
-    has_lower = interpret(r'regex_search("[a-z]", $pwd)', data)
-    has_digit = interpret(r'regex_search("\d", $pwd)', data)
-    has_special = interpret(r'regex_search("[^a-zA-Z0-9]", $pwd)', data)
+for pwd, (has_upper, has_lower, has_digit, has_special) in zip(passwords, checks):
     has_length = len(pwd) >= 8
 
     # Count requirements met
@@ -186,13 +194,11 @@ server_log = {
     "timestamp": "Timestamp: 2024-01-15T10:30:45.123Z",
 }
 
-# Extract HTTP method
-method = interpret(r'regex_extract("^(\\w+)\\s", $request, 1)', server_log)
-print(f"HTTP Method: {method}")
-
-# Extract user ID
-user_id = interpret(r'regex_extract("/users/(\\d+)", $request, 1)', server_log)
-print(f"User ID: {user_id}")
+# Extract HTTP method and user ID in a single pass over the request line
+server_log["request_fields"] = {"method": r"^(\w+)\s", "user_id": r"/users/(\d+)"}
+fields = interpret("regex_extract_many($request_fields, $request)", server_log)
+print(f"HTTP Method: {fields['method']}")
+print(f"User ID: {fields['user_id']}")
 
 # Extract all IP addresses
 ips = interpret(r'regex_findall("\\d+\\.\\d+\\.\\d+\\.\\d+", $ip_log)', server_log)
@@ -1,23 +1,33 @@
 # SPDX-FileCopyrightText: 2026-present Dane Howard <mirrord@gmail.com>
 #
 # SPDX-License-Identifier: MIT
-from drlang.language import (
-    interpret,
-    interpolate,
-    interpolate_dict,
-    DRLConfig,
-    DRLError,
-    DRLSyntaxError,
-    DRLNameError,
-    DRLTypeError,
-    DRLReferenceError,
-)
-from drlang.functions import register_function
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from drlang.language import (
+        interpret,
+        interpret_batch,
+        compile_expression,
+        interpolate,
+        interpolate_dict,
+        compile_dict,
+        DRLConfig,
+        DRLError,
+        DRLSyntaxError,
+        DRLNameError,
+        DRLTypeError,
+        DRLReferenceError,
+    )
+    from drlang.functions import register_function
 
-__all__ = [
+__all__ = (
     "interpret",
+    "interpret_batch",
+    "compile_expression",
     "interpolate",
     "interpolate_dict",
+    "compile_dict",
     "DRLConfig",
     "register_function",
     "DRLError",
@@ -25,4 +35,27 @@ __all__ = [
     "DRLNameError",
     "DRLTypeError",
     "DRLReferenceError",
-]
+)
+
+# Public names are imported from their module on first access (PEP 562), so
+# importing the package does not load the interpreter until it is used
+_LAZY_ATTRIBUTES = {name: "drlang.language" for name in __all__}
+_LAZY_ATTRIBUTES["register_function"] = "drlang.functions"
+
+# Submodules available as attributes after a bare ``import drlang``
+_SUBMODULES = frozenset(("cli", "functions", "language"))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return import_module(f"{__name__}.{name}")
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
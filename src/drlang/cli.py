@@ -7,15 +7,107 @@ and exploring available functions.
 import cmd
 import json
 import sys
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import inspect
 
-from drlang import interpret, interpolate_dict, DRLConfig
+from drlang import interpret, interpolate_dict, compile_expression, DRLConfig
 from drlang.functions import FUNCTIONS
 from drlang import (
     DRLError,
 )
 
+# Optional fast JSON parser for loading large context and template files
+try:
+    import orjson as _orjson
+except ImportError:  # no cov
+    _orjson = None
+
+
+# Function taxonomy shown by the ``functions`` command
+_CATEGORIES: Dict[str, list] = {
+    "String": [
+        "split",
+        "upper",
+        "lower",
+        "capitalize",
+        "strip",
+        "replace",
+        "find",
+        "join",
+        "contains_any",
+    ],
+    "Math": ["max", "min", "int", "float", "abs", "round"],
+    "Type": ["str", "bool", "int", "float"],
+    "Collection": ["len", "sorted", "reversed", "sum", "all", "any"],
+    "List": [
+        "list_get",
+        "list_slice",
+        "list_append",
+        "list_concat",
+        "list_contains",
+        "list_index",
+        "list_reverse",
+        "list_unique",
+        "list_flatten",
+        "columnar",
+    ],
+    "Iteration": ["map", "filter", "reduce"],
+    "Conditional": ["if"],
+    "Random": [
+        "random",
+        "randint",
+        "uniform",
+        "randrange",
+        "choice",
+        "shuffle",
+    ],
+    "DateTime": [
+        "datetime",
+        "date",
+        "time",
+        "timedelta",
+        "strptime",
+        "strftime",
+    ],
+    "Regex": [
+        "regex_search",
+        "regex_match",
+        "regex_findall",
+        "regex_sub",
+        "regex_split",
+        "regex_extract",
+        "regex_search_many",
+        "regex_extract_many",
+    ],
+    "I/O": ["print"],
+}
+
+# Inverted once at import: function name -> categories it is listed under
+_FUNCTION_CATEGORY: Dict[str, Tuple[str, ...]] = {}
+for _category, _names in _CATEGORIES.items():
+    for _name in _names:
+        _FUNCTION_CATEGORY[_name] = _FUNCTION_CATEGORY.get(_name, ()) + (_category,)
+del _category, _names, _name
+
+
+def _load_json(f) -> Any:
+    """Parse JSON from an open file, using orjson when it is installed."""
+    return _parse_json(f.read())
+
+
+def _parse_json(data) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    Documents orjson rejects but the json module accepts (NaN, integers wider
+    than 64 bits) are parsed with json, so results do not depend on the extra.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 class DRLangShell(cmd.Cmd):
     """Interactive shell for testing DRLang expressions."""
@@ -36,6 +128,10 @@ class DRLangShell(cmd.Cmd):
         self.config: Optional[DRLConfig] = None
         self.last_result = None
 
+    def _emit(self, *lines):
+        """Write several output lines with a single call to stdout."""
+        sys.stdout.write("\n".join(lines) + "\n")
+
     def emptyline(self):
         """Do nothing on empty line."""
         return False
@@ -114,6 +210,7 @@ class DRLangShell(cmd.Cmd):
         Usage:
             context                    - Show current context
             context load <file.json>   - Load context from JSON file
+            context loadnd <file>      - Merge one JSON object per line into context
             context clear              - Clear all context data
         """
         if not line.strip():
@@ -133,8 +230,24 @@ class DRLangShell(cmd.Cmd):
         elif command == "load" and len(parts) == 2:
             filename = parts[1]
             try:
-                with open(filename, "r") as f:
-                    self.context = json.load(f)
+                with open(filename, "rb") as f:
+                    self.context = _load_json(f)
+                print(f"Loaded context from {filename}")
+                print(f"Keys: {list(self.context.keys())}")
+            except FileNotFoundError:
+                print(f"Error: File '{filename}' not found")
+            except json.JSONDecodeError as e:
+                print(f"Error: Invalid JSON in file - {e}")
+            except Exception as e:
+                print(f"Error: {e}")
+        elif command == "loadnd" and len(parts) == 2:
+            filename = parts[1]
+            try:
+                # Parse line by line so only one record is held as text at once
+                with open(filename, "rb") as f:
+                    for line in f:
+                        if line.strip():
+                            self.context.update(_parse_json(line))
                 print(f"Loaded context from {filename}")
                 print(f"Keys: {list(self.context.keys())}")
             except FileNotFoundError:
@@ -144,7 +257,7 @@ class DRLangShell(cmd.Cmd):
             except Exception as e:
                 print(f"Error: {e}")
         else:
-            print("Error: Usage: context [load <file> | clear]")
+            print("Error: Usage: context [load <file> | loadnd <file> | clear]")
 
     def do_test(self, line):
         """Test multiple template strings from a dictionary mapping.
@@ -171,8 +284,8 @@ class DRLangShell(cmd.Cmd):
         if parts[0].lower() == "file" and len(parts) == 2:
             filename = parts[1]
             try:
-                with open(filename, "r") as f:
-                    expressions = json.load(f)
+                with open(filename, "rb") as f:
+                    expressions = _load_json(f)
             except FileNotFoundError:
                 print(f"Error: File '{filename}' not found")
                 return
@@ -190,22 +303,20 @@ class DRLangShell(cmd.Cmd):
             print("Error: Input must be a dictionary")
             return
 
-        print("\nTesting templates:")
-        print("=" * 70)
+        lines = ["\nTesting templates:", "=" * 70]
 
         try:
             results = interpolate_dict(expressions, self.context, self.config)
             for key, value in results.items():
-                template = (
-                    expressions[key]
-                    if isinstance(expressions[key], str)
-                    else "<nested>"
-                )
-                print(f"{key:20} {template:30} => {value!r}")
+                template = expressions[key]
+                if not isinstance(template, str):
+                    template = "<nested>"
+                lines.append(f"{key:20} {template:30} => {value!r}")
         except DRLError as e:
-            print(f"Error during interpolation: {e}")
+            lines.append(f"Error during interpolation: {e}")
 
-        print("=" * 70)
+        lines.append("=" * 70)
+        self._emit(*lines)
 
     def do_functions(self, pattern=""):
         """List all available functions or search by pattern.
@@ -230,81 +341,23 @@ class DRLangShell(cmd.Cmd):
             print(f"No functions matching '{pattern}'")
             return
 
-        print(f"\nAvailable functions ({len(matching)}):")
-        print("=" * 70)
-
-        # Group by category
-        categories = {
-            "String": [
-                "split",
-                "upper",
-                "lower",
-                "capitalize",
-                "strip",
-                "replace",
-                "find",
-                "join",
-            ],
-            "Math": ["max", "min", "int", "float", "abs", "round"],
-            "Type": ["str", "bool", "int", "float"],
-            "Collection": ["len", "sorted", "reversed", "sum", "all", "any"],
-            "List": [
-                "list_get",
-                "list_slice",
-                "list_append",
-                "list_concat",
-                "list_contains",
-                "list_index",
-                "list_reverse",
-                "list_unique",
-                "list_flatten",
-            ],
-            "Iteration": ["map", "filter", "reduce"],
-            "Conditional": ["if"],
-            "Random": [
-                "random",
-                "randint",
-                "uniform",
-                "randrange",
-                "choice",
-                "shuffle",
-            ],
-            "DateTime": [
-                "datetime",
-                "date",
-                "time",
-                "timedelta",
-                "strptime",
-                "strftime",
-            ],
-            "Regex": [
-                "regex_search",
-                "regex_match",
-                "regex_findall",
-                "regex_sub",
-                "regex_split",
-                "regex_extract",
-            ],
-            "I/O": ["print"],
-        }
-
-        categorized = set()
-        for category, funcs in categories.items():
-            category_matches = [f for f in funcs if f in matching]
-            if category_matches:
-                print(f"\n{category}:")
-                for func in category_matches:
-                    print(f"  • {func}")
-                    categorized.update(category_matches)
-
-        # Show uncategorized functions
-        uncategorized = [f for f in matching if f not in categorized]
-        if uncategorized:
-            print("\nOther:")
-            for func in uncategorized:
-                print(f"  • {func}")
-
-        print("\nType 'help <function_name>' for detailed help on a specific function.")
+        lines = [f"\nAvailable functions ({len(matching)}):", "=" * 70]
+
+        # Group by category in a single pass; a function may be in several
+        groups: Dict[str, list] = {}
+        for name in matching:
+            for category in _FUNCTION_CATEGORY.get(name, ("Other",)):
+                groups.setdefault(category, []).append(name)
+
+        for category in (*_CATEGORIES, "Other"):
+            if category in groups:
+                lines.append(f"\n{category}:")
+                lines.extend(f"  • {func}" for func in groups[category])
+
+        lines.append(
+            "\nType 'help <function_name>' for detailed help on a specific function."
+        )
+        self._emit(*lines)
 
     def do_help(self, arg):
         """Show help for commands or functions.
@@ -335,26 +388,26 @@ class DRLangShell(cmd.Cmd):
         """Show detailed help for a specific function."""
         func = FUNCTIONS[func_name]
 
-        print(f"\nFunction: {func_name}")
-        print("=" * 70)
+        lines = [f"\nFunction: {func_name}", "=" * 70]
 
         # Get function signature
         try:
             sig = inspect.signature(func)
-            print(f"Signature: {func_name}{sig}")
+            lines.append(f"Signature: {func_name}{sig}")
         except (ValueError, TypeError):
-            print(f"Signature: {func_name}(...)")
+            lines.append(f"Signature: {func_name}(...)")
 
         # Get docstring
         doc = inspect.getdoc(func)
         if doc:
-            print(f"\n{doc}")
+            lines.append(f"\n{doc}")
         else:
-            print("\nNo documentation available.")
+            lines.append("\nNo documentation available.")
 
-        print("\nUsage in DRLang:")
-        print(f"  {func_name}(arg1, arg2, ...)")
-        print(f"  Example: {func_name}($data, 'value')")
+        lines.append("\nUsage in DRLang:")
+        lines.append(f"  {func_name}(arg1, arg2, ...)")
+        lines.append(f"  Example: {func_name}($data, 'value')")
+        self._emit(*lines)
 
     def do_config(self, line):
         """Configure DRLang syntax.
@@ -496,9 +549,16 @@ Examples:
   drlang                           - Start interactive shell
   drlang -c "$user>name"           - Evaluate single expression
   drlang -f data.json -e "\$user>age * 2"
+  drlang -b -c "$user>name" < users.ndjson
         """,
     )
     parser.add_argument("-c", "--command", help="Evaluate a single expression and exit")
+    parser.add_argument(
+        "-b",
+        "--batch",
+        action="store_true",
+        help="Evaluate -c once per JSON context line read from stdin",
+    )
     parser.add_argument("-f", "--file", help="Load context data from JSON file")
     parser.add_argument("-e", "--expr", help="Expression to evaluate (requires -f)")
     parser.add_argument(
@@ -510,13 +570,42 @@ Examples:
 
     args = parser.parse_args()
 
+    # Batch mode: the expression is prepared once and run for every stdin line
+    if args.batch:
+        if not args.command:
+            print("Error: -b/--batch requires -c/--command", file=sys.stderr)
+            sys.exit(1)
+
+        config = None
+        if args.ref != "$" or args.delim != ">":
+            config = DRLConfig(args.ref, args.delim)
+
+        try:
+            evaluate = compile_expression(args.command, config)
+        except DRLError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        failed = False
+        for line in sys.stdin.buffer:
+            if not line.strip():
+                continue
+            try:
+                print(evaluate(_parse_json(line)))
+            except (DRLError, ValueError) as e:
+                print(f"Error: {e}", file=sys.stderr)
+                failed = True
+        if failed:
+            sys.exit(1)
+        return
+
     # Single command mode
     if args.command:
         context = {}
         if args.file:
             try:
-                with open(args.file, "r") as f:
-                    context = json.load(f)
+                with open(args.file, "rb") as f:
+                    context = _load_json(f)
             except Exception as e:
                 print(f"Error loading context: {e}", file=sys.stderr)
                 sys.exit(1)
@@ -540,8 +629,8 @@ Examples:
             sys.exit(1)
 
         try:
-            with open(args.file, "r") as f:
-                context = json.load(f)
+            with open(args.file, "rb") as f:
+                context = _load_json(f)
         except Exception as e:
             print(f"Error loading context: {e}", file=sys.stderr)
             sys.exit(1)
@@ -564,8 +653,8 @@ Examples:
     # Load context if provided
     if args.file:
         try:
-            with open(args.file, "r") as f:
-                shell.context = json.load(f)
+            with open(args.file, "rb") as f:
+                shell.context = _load_json(f)
             print(f"Loaded context from {args.file}")
             print(f"Keys: {list(shell.context.keys())}")
         except Exception as e:
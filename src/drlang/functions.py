@@ -1,7 +1,51 @@
 import builtins
+import datetime
 import inspect
+import os
+import random
 import re
-from typing import Any, Optional, get_type_hints, get_origin, Callable
+from functools import lru_cache, reduce, wraps
+from itertools import chain, compress, islice, repeat
+from typing import Any, Optional, Sequence, get_type_hints, get_origin, Callable
+
+try:
+    from re import _parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
+
+# Optional linear-time regex engine, enabled with DRL_USE_RE2=1. RE2 guarantees
+# matching in time linear in the input length, which protects against
+# catastrophic backtracking on user-supplied patterns. It is opt-in because its
+# results differ from re: \d, \w, \s and \b only match ASCII, and $ does not
+# match before a trailing newline. Set DRL_USE_RE=1 to force the stdlib engine.
+_re2 = None
+if os.environ.get("DRL_USE_RE2") == "1":
+    try:
+        import re2 as _re2
+    except ImportError:  # no cov
+        pass
+
+# Optional replacement for the stdlib backtracking engine, enabled with
+# DRL_USE_REGEX=1. The third-party regex module is a drop-in superset of re
+# (atomic groups, possessive quantifiers) used when RE2 is unavailable or
+# rejects a pattern.
+_backtracking = re
+if os.environ.get("DRL_USE_REGEX") == "1":
+    try:
+        import regex as _backtracking
+    except ImportError:  # no cov
+        pass
+
+if os.environ.get("DRL_USE_RE") == "1":
+    _re2 = None
+    _backtracking = re
+
+# Optional Aho-Corasick automaton for contains_any: scans for any number of
+# keywords in a single pass over the string.
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:  # no cov
+    _ahocorasick = None
 
 
 def print_value(*args: Any) -> None:
@@ -39,6 +83,197 @@ def if_function(condition: bool, true_value: Any, false_value: Any) -> Any:
 
 
 # Regex functions
+@lru_cache(maxsize=1024)
+def _compile(pattern: str) -> "re.Pattern":
+    """Compile a regex pattern, memoizing the result.
+
+    The regex_* functions are frequently called in loops with the same constant
+    pattern, so compiled patterns are kept in a dedicated cache rather than
+    relying on the (smaller, shared) cache inside the re module.
+
+    When DRL_USE_RE2=1 and google-re2 is installed the pattern is compiled with
+    RE2. Patterns RE2 cannot handle (backreferences, lookaround) fall back to the backtracking
+    engine: the stdlib re module, or the regex module when DRL_USE_REGEX=1.
+
+    Args:
+        pattern: Regular expression pattern
+
+    Returns:
+        The compiled pattern object
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern)
+        except _re2.error:
+            pass
+    try:
+        return _backtracking.compile(pattern)
+    except _backtracking.error:
+        if _backtracking is re:
+            raise
+        # Python-specific syntax the regex module rejects
+        return re.compile(pattern)
+
+
+# Pattern shapes that always match exactly one character
+_SINGLE_CHAR_OPS = (
+    _sre_parse.LITERAL,
+    _sre_parse.NOT_LITERAL,
+    _sre_parse.IN,
+    _sre_parse.ANY,
+)
+
+
+class _CharClassTable(dict):
+    """str.translate table for a pattern matching exactly one character.
+
+    Characters are classified against the compiled pattern the first time they
+    are seen; afterwards translate() resolves them with a plain dict lookup.
+    """
+
+    _MAX_ENTRIES = 4096
+
+    def __init__(self, compiled, replacement: str):
+        super().__init__()
+        self._fullmatch = compiled.fullmatch
+        self._replacement = replacement
+
+    def __missing__(self, codepoint: int):
+        value = self._replacement if self._fullmatch(chr(codepoint)) else codepoint
+        if len(self) < self._MAX_ENTRIES:
+            self[codepoint] = value
+        return value
+
+
+@lru_cache(maxsize=256)
+def _translation_table(pattern: str, replacement: str) -> Optional[_CharClassTable]:
+    """Build a str.translate table equivalent to re.sub(pattern, replacement, ...).
+
+    Only applies when the pattern is a single character or character class and
+    the replacement is literal (no backslash escapes or group references).
+
+    Returns:
+        The translate table, or None if the substitution needs the regex engine
+    """
+    if "\\" in replacement:
+        return None
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return None
+    if len(parsed) != 1 or parsed[0][0] not in _SINGLE_CHAR_OPS:
+        return None
+    return _CharClassTable(_compile(pattern), replacement)
+
+
+def _parse_plain(pattern: str):
+    """Parse a pattern, returning None if it uses case-insensitive matching or is invalid."""
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return None
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+    return parsed
+
+
+@lru_cache(maxsize=256)
+def _literal_text(pattern: str) -> Optional[str]:
+    """Return the text a pattern matches if it is a plain literal, else None.
+
+    Examples:
+        _literal_text(',')     -> ','
+        _literal_text(r'\\.')  -> '.'
+        _literal_text(r'\\d')  -> None
+    """
+    parsed = _parse_plain(pattern)
+    if not parsed or any(op is not _sre_parse.LITERAL for op, _ in parsed):
+        return None
+    return "".join(chr(av) for _, av in parsed)
+
+
+@lru_cache(maxsize=256)
+def _literal_alternatives(pattern: str) -> Optional[tuple]:
+    """Return the branches of a literal or an alternation of literals ('A|B|C'), else None."""
+    literal = _literal_text(pattern)
+    if literal is not None:
+        return (literal,)
+    if "|" not in pattern or "\\" in pattern:
+        return None
+    branches = tuple(_literal_text(branch) for branch in pattern.split("|"))
+    if None in branches:
+        return None
+    return branches
+
+
+@lru_cache(maxsize=256)
+def _class_members(pattern: str) -> Optional[tuple]:
+    """Expand a single ASCII character class (e.g. '[A-Z]', '[^a-z0-9]') to a set.
+
+    Returns:
+        (negated, members) or None if the pattern is not such a class
+    """
+    parsed = _parse_plain(pattern)
+    if not parsed or len(parsed) != 1 or parsed[0][0] is not _sre_parse.IN:
+        return None
+    negated = False
+    members = set()
+    for op, av in parsed[0][1]:
+        if op is _sre_parse.NEGATE:
+            negated = True
+        elif op is _sre_parse.LITERAL and av < 128:
+            members.add(chr(av))
+        elif op is _sre_parse.RANGE and av[1] < 128:
+            members.update(chr(c) for c in range(av[0], av[1] + 1))
+        else:
+            return None
+    return negated, frozenset(members)
+
+
+# Above this length the regex engine's scan beats set membership
+_CLASS_SCAN_MAX_LEN = 256
+
+
+@lru_cache(maxsize=256)
+def _literal_class_split(pattern: str) -> Optional[tuple]:
+    """Plan a split on a class made only of literals (e.g. '[,;|]').
+
+    Returns:
+        (separator, table) where translating with table maps every member of the
+        class to separator, or None if the pattern is not such a class
+    """
+    parsed = _parse_plain(pattern)
+    if not parsed or len(parsed) != 1 or parsed[0][0] is not _sre_parse.IN:
+        return None
+    items = parsed[0][1]
+    if any(op is not _sre_parse.LITERAL for op, _ in items):
+        return None
+    members = "".join(chr(av) for _, av in items)
+    separator = members[0]
+    return separator, str.maketrans(members, separator * len(members))
+
+
+# Results of the boolean/extract regex builtins are memoized on their
+# arguments, since the same expression is often re-evaluated on repeated
+# inputs. Longer strings bypass the cache so it never pins large texts.
+_MEMO_MAX_LEN = 4096
+
+
+def _memoized(func: Callable) -> Callable:
+    """Memoize a regex builtin for strings up to _MEMO_MAX_LEN characters."""
+    cached = lru_cache(maxsize=2048)(func)
+
+    @wraps(func)
+    def wrapper(pattern, string, *args, **kwargs):
+        if len(string) <= _MEMO_MAX_LEN:
+            return cached(pattern, string, *args, **kwargs)
+        return func(pattern, string, *args, **kwargs)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_memoized
 def regex_search(pattern: str, string: str) -> bool:
     """Search for pattern in string. Returns True if found, False otherwise.
 
@@ -53,9 +288,20 @@ def regex_search(pattern: str, string: str) -> bool:
         regex_search(r'\\d+', 'abc123')  -> True
         regex_search(r'^hello', 'hello world')  -> True
     """
-    return re.search(pattern, string) is not None
-
-
+    alternatives = _literal_alternatives(pattern)
+    if alternatives is not None:
+        return any(text in string for text in alternatives)
+    if len(string) <= _CLASS_SCAN_MAX_LEN:
+        char_class = _class_members(pattern)
+        if char_class is not None:
+            negated, members = char_class
+            if negated:
+                return not members.issuperset(string)
+            return not members.isdisjoint(string)
+    return bool(_compile(pattern).search(string))
+
+
+@_memoized
 def regex_match(pattern: str, string: str) -> bool:
     """Check if string matches pattern at the beginning. Returns True if matches, False otherwise.
 
@@ -70,7 +316,10 @@ def regex_match(pattern: str, string: str) -> bool:
         regex_match(r'\\d+', '123abc')  -> True
         regex_match(r'\\d+', 'abc123')  -> False
     """
-    return re.match(pattern, string) is not None
+    alternatives = _literal_alternatives(pattern)
+    if alternatives is not None:
+        return string.startswith(alternatives)
+    return bool(_compile(pattern).match(string))
 
 
 def regex_findall(pattern: str, string: str) -> list:
@@ -87,7 +336,7 @@ def regex_findall(pattern: str, string: str) -> list:
         regex_findall(r'\\d+', 'a1b22c333')  -> ['1', '22', '333']
         regex_findall(r'\\w+', 'hello world')  -> ['hello', 'world']
     """
-    return re.findall(pattern, string)
+    return _compile(pattern).findall(string)
 
 
 def regex_sub(pattern: str, replacement: str, string: str) -> str:
@@ -105,7 +354,15 @@ def regex_sub(pattern: str, replacement: str, string: str) -> str:
         regex_sub(r'\\d+', 'X', 'a1b22c333')  -> 'aXbXcX'
         regex_sub(r'\\s+', '_', 'hello  world')  -> 'hello_world'
     """
-    return re.sub(pattern, replacement, string)
+    if "\\" not in replacement:
+        literal = _literal_text(pattern)
+        if literal is not None:
+            return string.replace(literal, replacement)
+    # Single-character patterns are a per-character table rewrite
+    table = _translation_table(pattern, replacement)
+    if table is not None:
+        return string.translate(table)
+    return _compile(pattern).sub(replacement, string)
 
 
 def regex_split(pattern: str, string: str) -> list:
@@ -122,9 +379,18 @@ def regex_split(pattern: str, string: str) -> list:
         regex_split(r'\\s+', 'hello  world  test')  -> ['hello', 'world', 'test']
         regex_split(r'[,;]', 'a,b;c')  -> ['a', 'b', 'c']
     """
-    return re.split(pattern, string)
-
-
+    # Literal separators don't need the regex engine
+    literal = _literal_text(pattern)
+    if literal is not None:
+        return string.split(literal)
+    plan = _literal_class_split(pattern)
+    if plan is not None:
+        separator, table = plan
+        return string.translate(table).split(separator)
+    return _compile(pattern).split(string)
+
+
+@_memoized
 def regex_extract(pattern: str, string: str, group: int = 0) -> str:
     """Extract the first match of pattern from string.
 
@@ -140,12 +406,158 @@ def regex_extract(pattern: str, string: str, group: int = 0) -> str:
         regex_extract(r'\\d+', 'abc123def')  -> '123'
         regex_extract(r'(\\w+)@(\\w+)', 'user@domain', 1)  -> 'user'
     """
-    match = re.search(pattern, string)
+    match = _compile(pattern).search(string)
     if match:
         return match.group(group)
     return ""
 
 
+def regex_search_many(patterns: list, string: str) -> list:
+    """Search for several patterns in the same string.
+
+    Equivalent to calling regex_search once per pattern, but a single call
+    replaces a chain of separate expression evaluations.
+
+    Args:
+        patterns: List of regular expression patterns
+        string: String to search in
+
+    Returns:
+        List of booleans, one per pattern, True where the pattern was found
+
+    Examples:
+        regex_search_many(['[A-Z]', '\\d'], 'Pass1')  -> [True, True]
+        regex_search_many(['[A-Z]', '\\d'], 'pass')   -> [False, False]
+    """
+    return [regex_search(str(pattern), string) for pattern in patterns]
+
+
+def regex_extract_many(named_patterns: dict, string: str) -> dict:
+    """Extract several named fields from a string in a single scan.
+
+    The patterns are fused into one alternation, so the string is usually
+    walked once rather than once per pattern. Each field gets the pattern's
+    first capture group if it has one, otherwise the whole match, exactly as
+    regex_extract would return it.
+
+    Args:
+        named_patterns: Dict mapping field names to regular expression patterns
+        string: String to extract from
+
+    Returns:
+        Dict with the first match for each field, or empty string if not found
+
+    Examples:
+        regex_extract_many({'method': '^(\\w+)', 'id': '/users/(\\d+)'}, 'GET /users/7')
+            -> {'method': 'GET', 'id': '7'}
+    """
+    items = tuple((str(name), str(pattern)) for name, pattern in named_patterns.items())
+    result = {name: "" for name, _ in items}
+    found = [False] * len(items)
+
+    fused = _fused_pattern(items)
+    if fused is not None:
+        compiled, branches = fused
+        # A fused match is the pattern's own first match only if the scan tried
+        # that pattern at every earlier position. A match skips the branches
+        # after its own at its start, and every position inside it.
+        trusted = len(items)
+        for match in compiled.finditer(string):
+            order, group = branches[match.lastindex]
+            if order < trusted and not found[order]:
+                result[items[order][0]] = match.group(group)
+                found[order] = True
+            start, end = match.span()
+            trusted = min(trusted, order + 1) if end - start <= 1 else 0
+            if all(found[:trusted]):
+                break
+
+    # Anything the fused scan could not vouch for is searched on its own
+    for order, (name, pattern) in enumerate(items):
+        if not found[order]:
+            compiled = _compile(pattern)
+            match = compiled.search(string)
+            if match:
+                result[name] = match.group(1 if compiled.groups else 0)
+    return result
+
+
+# Backreferences and conditionals refer to groups by number, so they would
+# point at the wrong group once patterns are wrapped and combined
+_BACKREFERENCE = re.compile(r"\\\d|\(\?P=|\(\?\(")
+
+
+@lru_cache(maxsize=128)
+def _fused_pattern(items: tuple) -> Optional[tuple]:
+    """Combine (name, pattern) pairs into one alternation for regex_extract_many.
+
+    Returns:
+        (compiled, branches) where branches maps each wrapper group index to
+        (position in items, group to extract), or None if the patterns can't
+        be combined without changing how any of them matches
+    """
+    branches = {}
+    parts = []
+    compiled_parts = []
+    index = 1
+    for order, (_, pattern) in enumerate(items):
+        if _BACKREFERENCE.search(pattern):
+            return None
+        try:
+            compiled = _compile(pattern)
+        except Exception:
+            return None
+        branches[index] = (order, index + 1 if compiled.groups else index)
+        parts.append(f"({pattern})")
+        compiled_parts.append(compiled)
+        index += compiled.groups + 1
+    try:
+        fused = _compile("|".join(parts))
+    except Exception:
+        return None
+    # Every pattern must run on the same engine with the same flags as alone
+    if any(
+        type(compiled) is not type(fused) or compiled.flags != fused.flags
+        for compiled in compiled_parts
+    ):
+        return None
+    return fused, branches
+
+
+# Keyword functions
+@lru_cache(maxsize=128)
+def _keyword_automaton(keywords: tuple):
+    """Build (and cache) an Aho-Corasick automaton for a set of keywords."""
+    automaton = _ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def contains_any(keywords: list, string: str) -> bool:
+    """Check if any of the keywords occurs in string.
+
+    Uses a cached Aho-Corasick automaton when pyahocorasick is installed, so
+    the string is scanned once no matter how many keywords there are.
+
+    Args:
+        keywords: List of substrings to look for
+        string: String to search in
+
+    Returns:
+        True if at least one keyword is a substring of string
+
+    Examples:
+        contains_any(['ERROR', 'FATAL'], 'ERROR: disk full')  -> True
+        contains_any(['ERROR', 'FATAL'], 'INFO: ok')          -> False
+    """
+    keywords = tuple(sorted({str(keyword) for keyword in keywords}))
+    if _ahocorasick is not None and keywords and keywords[0]:
+        return next(_keyword_automaton(keywords).iter(string), None) is not None
+    return any(keyword in string for keyword in keywords)
+
+
 # List functions
 def list_get(lst: list, index: int, default: Any = None) -> Any:
     """Get item from list at index, with optional default value.
@@ -273,6 +685,9 @@ def list_reverse(lst: list) -> list:
     Examples:
         list_reverse([1, 2, 3])  -> [3, 2, 1]
     """
+    # Slicing copies in one step, but keeps the type of other sequences
+    if isinstance(lst, list):
+        return lst[::-1]
     return list(reversed(lst))
 
 
@@ -288,13 +703,11 @@ def list_unique(lst: list) -> list:
     Examples:
         list_unique([1, 2, 2, 3, 1])  -> [1, 2, 3]
     """
-    seen = set()
-    result = []
-    for item in lst:
-        if item not in seen:
-            seen.add(item)
-            result.append(item)
-    return result
+    return list(dict.fromkeys(lst))
+
+
+# Item types list_flatten expands
+_FLATTENED_TYPES = (list, tuple)
 
 
 def list_flatten(lst: list) -> list:
@@ -309,15 +722,61 @@ def list_flatten(lst: list) -> list:
     Examples:
         list_flatten([[1, 2], [3, 4]])  -> [1, 2, 3, 4]
     """
+    # A list made only of lists and tuples is joined in one C-level pass
+    if all(map(isinstance, lst, repeat(_FLATTENED_TYPES))):
+        return list(chain.from_iterable(lst))
     result = []
     for item in lst:
-        if isinstance(item, (list, tuple)):
+        if isinstance(item, _FLATTENED_TYPES):
             result.extend(item)
         else:
             result.append(item)
     return result
 
 
+def columnar(records: list) -> dict:
+    """Pivot a list of records into a dictionary of columns.
+
+    Each key found in any record maps to a list with one value per record,
+    in record order; records without that key contribute None. Projecting a
+    field then takes a single lookup instead of a map over every record.
+
+    Args:
+        records: List of dictionaries
+
+    Returns:
+        Dictionary mapping each key to its list of values
+
+    Examples:
+        columnar([{"a": 1, "b": 2}, {"a": 3}])  -> {"a": [1, 3], "b": [2, None]}
+    """
+    keys = dict.fromkeys(key for record in records for key in record)
+    return {key: [record.get(key) for record in records] for key in keys}
+
+
+def _item_operands(
+    operation: Optional[tuple], keys: tuple, *columns
+) -> Optional[tuple]:
+    """Operator function and operand iterables for a whole-list operation.
+
+    operation comes from language._binary_operation; keys name the
+    references columns stand for. Literals repeat for every element. None if
+    the expression references anything else.
+    """
+    if operation is None:
+        return None
+    apply, *operands = operation
+    iterables = []
+    for is_reference, value in operands:
+        if not is_reference:
+            iterables.append(repeat(value))
+        elif value in keys:
+            iterables.append(columns[keys.index(value)])
+        else:
+            return None
+    return apply, iterables
+
+
 def map_list(expression: str, lst: list, context: Optional[dict] = None) -> list:
     """Apply an expression to each element of a list.
 
@@ -337,7 +796,7 @@ def map_list(expression: str, lst: list, context: Optional[dict] = None) -> list
         map("upper($item)", ["a", "b"])       -> ["A", "B"]
         map("$item + $index", [10, 20, 30])   -> [10, 21, 32]
     """
-    from drlang.language import interpret
+    from drlang.language import compile_expression, _binary_operation
 
     # If context is None, initialize empty dict
     if context is None:
@@ -347,11 +806,28 @@ def map_list(expression: str, lst: list, context: Optional[dict] = None) -> list
         context = {"value": context}
 
     results = []
+    # Non-iterables (None, numbers) raise TypeError before the expression is
+    # looked at, and empty lists return without it
+    iter(lst)
+    if not lst:
+        return results
+    # A single operation on $item runs as one map() over the list; on any
+    # error the loop below reports it
+    whole_list = _item_operands(_binary_operation(expression), ("item",), lst)
+    if whole_list is not None:
+        try:
+            return list(map(whole_list[0], *whole_list[1]))
+        except Exception:
+            pass
+    # Parse once; the expression is only checked when there are items
+    evaluate = compile_expression(expression)
+    # Expressions can't keep hold of their context, so one dict is reused
+    eval_context = {**context}
     for index, item in enumerate(lst):
-        # Create context with item and index
-        eval_context = {**context, "item": item, "index": index}
-        result = interpret(expression, eval_context)
-        results.append(result)
+        # Update context with item and index
+        eval_context["item"] = item
+        eval_context["index"] = index
+        results.append(evaluate(eval_context))
 
     return results
 
@@ -374,16 +850,34 @@ def filter_list(expression: str, lst: list, context: Optional[dict] = None) -> l
         filter_list("$item > 2", [1, 2, 3, 4])      -> [3, 4]
         filter_list("$index % 2 == 0", [10, 20, 30, 40])  -> [10, 30]
     """
-    from drlang.language import interpret
+    from drlang.language import compile_expression, _binary_operation
 
     if context is None:
         context = {}
 
     results = []
+    # Non-iterables (None, numbers) raise TypeError before the expression is
+    # looked at, and empty lists return without it
+    iter(lst)
+    if not lst:
+        return results
+    # A single comparison or operation on $item is evaluated for the whole
+    # list at once; on any error the loop below reports it
+    whole_list = _item_operands(_binary_operation(expression), ("item",), lst)
+    if whole_list is not None:
+        try:
+            return list(compress(lst, map(whole_list[0], *whole_list[1])))
+        except Exception:
+            pass
+    # Parse once; the expression is only checked when there are items
+    evaluate = compile_expression(expression)
+    # Expressions can't keep hold of their context, so one dict is reused
+    eval_context = {**context}
     for index, item in enumerate(lst):
-        # Create context with item and index
-        eval_context = {**context, "item": item, "index": index}
-        if interpret(expression, eval_context):
+        # Update context with item and index
+        eval_context["item"] = item
+        eval_context["index"] = index
+        if evaluate(eval_context):
             results.append(item)
 
     return results
@@ -411,7 +905,7 @@ def reduce_list(
         reduce_list("$acc + $item", [1, 2, 3], 10)      -> 16
         reduce_list("if($item > $acc, $item, $acc)", [5, 2, 8, 3])  -> 8
     """
-    from drlang.language import interpret
+    from drlang.language import compile_expression, _binary_operation
 
     if context is None:
         context = {}
@@ -426,9 +920,29 @@ def reduce_list(
         accumulator = initial
         start_index = 0
 
-    for item in lst[start_index:]:
-        eval_context = {**context, "acc": accumulator, "item": item}
-        accumulator = interpret(expression, eval_context)
+    # Sequences are iterated in place; anything else is sliced as it always
+    # was, so inputs like dicts and numbers fail the same way
+    if not isinstance(lst, Sequence):
+        lst = lst[start_index:]
+        start_index = 0
+    if len(lst) <= start_index:
+        return accumulator
+    # $acc <op> $item folds in one functools.reduce call; on any error the
+    # loop below reports it
+    operation = _binary_operation(expression)
+    if operation is not None and operation[1:] == ((True, "acc"), (True, "item")):
+        try:
+            return reduce(operation[0], islice(lst, start_index, None), accumulator)
+        except Exception:
+            pass
+    # Parse once; the expression is only checked when there are items
+    evaluate = compile_expression(expression)
+    # Expressions can't keep hold of their context, so one dict is reused
+    eval_context = {**context}
+    for item in islice(lst, start_index, None):
+        eval_context["acc"] = accumulator
+        eval_context["item"] = item
+        accumulator = evaluate(eval_context)
 
     return accumulator
 
@@ -451,19 +965,20 @@ FUNCTIONS = {
     "replace": str.replace,
     "find": str.find,
     "join": str.join,
+    "contains_any": contains_any,
     "split": str.split,
-    "randint": __import__("random").randint,
-    "random": __import__("random").random,
-    "uniform": __import__("random").uniform,
-    "randrange": __import__("random").randrange,
-    "choice": __import__("random").choice,
-    "shuffle": __import__("random").shuffle,
-    "datetime": __import__("datetime").datetime,
-    "date": __import__("datetime").date,
-    "time": __import__("datetime").time,
-    "timedelta": __import__("datetime").timedelta,
-    "strptime": __import__("datetime").datetime.strptime,
-    "strftime": __import__("datetime").datetime.strftime,
+    "randint": random.randint,
+    "random": random.random,
+    "uniform": random.uniform,
+    "randrange": random.randrange,
+    "choice": random.choice,
+    "shuffle": random.shuffle,
+    "datetime": datetime.datetime,
+    "date": datetime.date,
+    "time": datetime.time,
+    "timedelta": datetime.timedelta,
+    "strptime": datetime.datetime.strptime,
+    "strftime": datetime.datetime.strftime,
     "all": all,
     "any": any,
     # Regex functions
@@ -473,6 +988,8 @@ FUNCTIONS = {
     "regex_sub": regex_sub,
     "regex_split": regex_split,
     "regex_extract": regex_extract,
+    "regex_search_many": regex_search_many,
+    "regex_extract_many": regex_extract_many,
     # List functions
     "list_get": list_get,
     "list_slice": list_slice,
@@ -483,6 +1000,7 @@ FUNCTIONS = {
     "list_reverse": list_reverse,
     "list_unique": list_unique,
     "list_flatten": list_flatten,
+    "columnar": columnar,
     "map": map_list,
     "filter": filter_list,
     "reduce": reduce_list,
@@ -491,97 +1009,265 @@ FUNCTIONS = {
 }
 
 
-def convert_arg_types(function, *args) -> list:
+def _int_arg(value: Any) -> Any:
+    """Coerce a value to int the way convert_arg_types would, keeping it on failure."""
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _fast_regex_search(pattern, string):
+    return regex_search(str(pattern), str(string))
+
+
+def _fast_regex_match(pattern, string):
+    return regex_match(str(pattern), str(string))
+
+
+def _fast_regex_findall(pattern, string):
+    return _compile(str(pattern)).findall(str(string))
+
+
+def _fast_regex_sub(pattern, replacement, string):
+    return regex_sub(str(pattern), str(replacement), str(string))
+
+
+def _fast_regex_split(pattern, string):
+    return regex_split(str(pattern), str(string))
+
+
+def _fast_regex_extract(pattern, string, group=0):
+    return regex_extract(str(pattern), str(string), _int_arg(group))
+
+
+# Specialized entry points for builtins whose signatures are known up front.
+# They apply the same coercions as convert_arg_types inline, so execute() can
+# skip signature inspection entirely. Keyed by the callable (not the name) so
+# a function registered over a builtin name never takes the fast path.
+_FAST_DISPATCH = {
+    regex_search: _fast_regex_search,
+    regex_match: _fast_regex_match,
+    regex_findall: _fast_regex_findall,
+    regex_sub: _fast_regex_sub,
+    regex_split: _fast_regex_split,
+    regex_extract: _fast_regex_extract,
+}
+
+# Builtins that accept any argument types: they are C functions or methods
+# without inspectable annotations, or annotated only with Any, so
+# convert_arg_types would return their arguments unchanged anyway. Other
+# functions with nothing to convert are added on first use by _converts_args.
+_NO_CONVERT = set(
+    FUNCTIONS[name]
+    for name in (
+        "print",
+        "add",
+        "len",
+        "max",
+        "min",
+        "int",
+        "float",
+        "str",
+        "bool",
+        "upper",
+        "lower",
+        "capitalize",
+        "strip",
+        "replace",
+        "find",
+        "join",
+        "split",
+        "all",
+        "any",
+        "sorted",
+    )
+)
+
+
+@lru_cache(maxsize=256)
+def bind_pattern(func: Callable, pattern: str) -> Optional[Callable]:
+    """Specialize a regex builtin for a constant pattern argument.
+
+    Pattern analysis and compilation happen once here instead of on every call,
+    so expressions with a literal pattern skip the per-call cache lookups.
+
+    Args:
+        func: One of the regex_* builtins
+        pattern: The constant pattern argument
+
+    Returns:
+        Callable taking the remaining arguments (with the same coercions as
+        execute), or None if func is not a regex builtin or pattern is invalid
+
+    Examples:
+        bind_pattern(regex_search, r'\\d+')('abc123')  -> True
     """
-    Convert argument types based on the function's expected input types.
+    try:
+        compiled = _compile(pattern)
+    except Exception:
+        return None
+
+    if func is regex_search:
+        if _literal_alternatives(pattern) is None and _class_members(pattern) is None:
+            search = compiled.search
+            return lambda string: bool(search(str(string)))
+        return lambda string: regex_search(pattern, str(string))
+    if func is regex_match:
+        if _literal_alternatives(pattern) is None:
+            match = compiled.match
+            return lambda string: bool(match(str(string)))
+        return lambda string: regex_match(pattern, str(string))
+    if func is regex_findall:
+        findall = compiled.findall
+        return lambda string: findall(str(string))
+    if func is regex_sub:
+        return lambda replacement, string: regex_sub(
+            pattern, str(replacement), str(string)
+        )
+    if func is regex_split:
+        if _literal_text(pattern) is None and _literal_class_split(pattern) is None:
+            split = compiled.split
+            return lambda string: split(str(string))
+        return lambda string: regex_split(pattern, str(string))
+    if func is regex_extract:
+        search = compiled.search
+
+        def extract(string, group=0):
+            match = search(str(string))
+            if match:
+                return match.group(_int_arg(group))
+            return ""
+
+        return extract
+    return None
+
+
+@lru_cache(maxsize=256)
+def _signature_info(function) -> Optional[tuple]:
+    """Inspect a callable once and return the parameters worth converting.
 
     Args:
         function: The function to inspect for type hints
-        *args: Arguments to convert
 
     Returns:
-        List of converted arguments
+        Tuple of (position, expected_type) pairs in position order, one for
+        each annotated parameter other than *args and **kwargs. None if the
+        callable has no inspectable signature (e.g., some built-ins).
     """
-    # If no args, return empty list
-    if not args:
-        return []
-
     try:
-        # Try to get the function signature
         sig = inspect.signature(function)
-        params = list(sig.parameters.values())
+    except (ValueError, TypeError):
+        return None
 
-        # Try to get type hints
+    # Annotations are usually real types already; only resolve forward
+    # references (string annotations) through get_type_hints
+    type_hints = getattr(function, "__annotations__", None) or {}
+    if any(isinstance(hint, str) for hint in type_hints.values()):
         try:
             type_hints = get_type_hints(function)
         except Exception:
             type_hints = {}
 
-        converted = []
-
-        for i, arg in enumerate(args):
-            # If we have a parameter at this position
-            if i < len(params):
-                param = params[i]
-                param_name = param.name
-
-                # Skip *args and **kwargs parameters
-                if param.kind in (
-                    inspect.Parameter.VAR_POSITIONAL,
-                    inspect.Parameter.VAR_KEYWORD,
-                ):
-                    # For variadic args, just pass through
-                    converted.append(arg)
+    params = []
+    for position, param in enumerate(sig.parameters.values()):
+        if param.kind in (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        ):
+            continue
+        if param.name in type_hints:
+            expected_type = type_hints[param.name]
+        elif param.annotation != inspect.Parameter.empty:
+            expected_type = param.annotation
+        else:
+            expected_type = None
+        if expected_type is None:
+            continue
+
+        # Handle generic types (like List, Dict, etc.)
+        origin = get_origin(expected_type)
+        if origin is not None:
+            expected_type = origin
+
+        params.append((position, expected_type))
+    return tuple(params)
+
+
+def _converts_args(func: Callable) -> bool:
+    """Check whether convert_arg_types can change the arguments of func.
+
+    Functions without a signature or annotated parameters (e.g. the random and
+    datetime builtins) are added to _NO_CONVERT the first time they are seen,
+    so later calls skip this check.
+    """
+    try:
+        params = _signature_info(func)
+    except TypeError:
+        # Unhashable callables can't be cached or remembered
+        return True
+    if params:
+        return True
+    _NO_CONVERT.add(func)
+    return False
+
+
+def convert_arg_types(function, *args) -> Sequence:
+    """
+    Convert argument types based on the function's expected input types.
+
+    Signature inspection is cached per callable, so repeated calls only pay
+    for the isinstance checks and conversions themselves.
+
+    Args:
+        function: The function to inspect for type hints
+        *args: Arguments to convert
+
+    Returns:
+        Sequence of converted arguments; the original args tuple when nothing
+        needed converting, otherwise a new list
+    """
+    # If no args, nothing to convert
+    if not args:
+        return args
+
+    try:
+        try:
+            params = _signature_info(function)
+        except TypeError:
+            # Unhashable callables can't be cached; inspect them directly
+            params = _signature_info.__wrapped__(function)
+        if not params:
+            return args
+
+        # Only allocate a new list once a conversion actually happens
+        converted = None
+
+        # Args beyond the last parameter (variadic case) pass through
+        count = len(args)
+        for i, expected_type in params:
+            if i >= count:
+                break
+
+            # Try to convert if not already the expected type
+            arg = args[i]
+            if not isinstance(arg, expected_type):
+                try:
+                    new_arg = expected_type(arg)
+                except (TypeError, ValueError):
+                    # If conversion fails, use original arg
                     continue
+                if converted is None:
+                    converted = list(args)
+                converted[i] = new_arg
 
-                # Check if we have a type hint for this parameter
-                if param_name in type_hints:
-                    expected_type = type_hints[param_name]
-
-                    # Handle generic types (like List, Dict, etc.)
-                    origin = get_origin(expected_type)
-                    if origin is not None:
-                        expected_type = origin
-
-                    # Try to convert if not already the expected type
-                    if not isinstance(arg, expected_type):
-                        try:
-                            converted.append(expected_type(arg))
-                        except (TypeError, ValueError):
-                            # If conversion fails, use original arg
-                            converted.append(arg)
-                    else:
-                        converted.append(arg)
-                # Check annotation directly on parameter
-                elif param.annotation != inspect.Parameter.empty:
-                    expected_type = param.annotation
-
-                    # Handle generic types
-                    origin = get_origin(expected_type)
-                    if origin is not None:
-                        expected_type = origin
-
-                    # Try to convert if not already the expected type
-                    if not isinstance(arg, expected_type):
-                        try:
-                            converted.append(expected_type(arg))
-                        except (TypeError, ValueError):
-                            # If conversion fails, use original arg
-                            converted.append(arg)
-                    else:
-                        converted.append(arg)
-                else:
-                    # No type hint, pass through as-is
-                    converted.append(arg)
-            else:
-                # More args than parameters (variadic case), pass through
-                converted.append(arg)
-
-        return converted
+        return args if converted is None else converted
 
     except (ValueError, TypeError):
         # If we can't inspect the function (e.g., built-in), pass args through
-        return list(args)
+        return args
 
 
 def execute(function_name, *args, config=None):
@@ -598,31 +1284,88 @@ def execute(function_name, *args, config=None):
     Raises:
         NameError: If the function is not found
     """
-    # Check custom functions first (if config provided)
-    if (
-        config
-        and hasattr(config, "custom_functions")
-        and function_name in config.custom_functions
-    ):
-        func = config.custom_functions[function_name]
-        converted_args = convert_arg_types(func, *args)
-        return func(*converted_args)
-
-    # Fall back to built-in functions
-    if function_name not in FUNCTIONS:
+    # Check custom functions first (if config provided). DRLConfig always
+    # initializes custom_functions, so no attribute check is needed.
+    if config is not None:
+        func = config.custom_functions.get(function_name)
+        if func is not None:
+            converted_args = convert_arg_types(func, *args)
+            return func(*converted_args)
+
+    # Fall back to built-in functions (one dict lookup instead of `in` + `[]`)
+    func = FUNCTIONS.get(function_name)
+    if func is None:
         raise NameError(f"Function '{function_name}' not found")
-    func = FUNCTIONS[function_name]
+    known = _known_caller(func)
+    if known is not None:
+        return known(*args)
     converted_args = convert_arg_types(func, *args)
     return func(*converted_args)
 
 
-def register_function(name: str, func: Callable, config=None):
+def _known_caller(func: Callable) -> Optional[Callable]:
+    """Return a callable running func without convert_arg_types, if there is one."""
+    try:
+        fast = _FAST_DISPATCH.get(func)
+        if fast is not None:
+            return fast
+        if func in _NO_CONVERT:
+            return func
+    except TypeError:
+        # Unhashable callables (e.g. defining __eq__ only) are never builtins
+        return None
+    return None if _converts_args(func) else func
+
+
+def direct_caller(func: Callable) -> Callable:
+    """Return a callable that runs built-in func the way execute() would.
+
+    This is the part of execute() that follows name resolution, so a caller
+    that has already resolved a function name can skip it.
+
+    Args:
+        func: A function from FUNCTIONS
+
+    Returns:
+        A callable taking the same arguments as execute() passes on
+    """
+    known = _known_caller(func)
+    if known is not None:
+        return known
+
+    def call(*args):
+        return func(*convert_arg_types(func, *args))
+
+    return call
+
+
+def _memoized_pure(func: Callable) -> Callable:
+    """Memoize a pure function, calling it directly for unhashable arguments."""
+    # typed so that e.g. f(1), f(1.0) and f(True) are cached separately
+    cached = lru_cache(maxsize=2048, typed=True)(func)
+
+    @wraps(func)
+    def wrapper(*args):
+        try:
+            hash(args)
+        except TypeError:
+            return func(*args)
+        return cached(*args)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def register_function(name: str, func: Callable, config=None, pure: bool = False):
     """Register a custom function for use in DRL expressions.
 
     Args:
         name: Name to register the function under
         func: The callable function to register
         config: Optional DRLConfig to add function to. If None, adds to global FUNCTIONS
+        pure: If True, func depends only on its arguments and has no side
+            effects, so results are cached per argument tuple. Cached results
+            are shared between calls and must not be modified.
 
     Returns:
         The DRLConfig object (if provided) for method chaining
@@ -634,10 +1377,13 @@ def register_function(name: str, func: Callable, config=None):
         # Register to specific config
         config = DRLConfig()
         register_function('triple', lambda x: x * 3, config)
+
+        # Cache results of an expensive pure function
+        register_function('fib', fib, pure=True)
     """
+    if pure:
+        func = _memoized_pure(func)
     if config is not None:
-        if not hasattr(config, "custom_functions"):
-            config.custom_functions = {}
         config.custom_functions[name] = func
         return config
     else:
@@ -1,3 +1,8 @@
+import operator
+import re
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any, Dict, List, Union, Optional, Callable
 import drlang.functions as functions
 
@@ -117,10 +122,22 @@ DEFAULT_CONFIG = DRLConfig()
 class Token:
     """Represents a token in a DRL expression."""
 
-    def __init__(self, type_: str, value: str, behavior: str = "required"):
+    def __init__(
+        self,
+        type_: str,
+        value: str,
+        behavior: str = "required",
+        path: Optional[tuple] = None,
+        numeric: Union[int, float, None] = None,
+    ):
         self.type = type_
         self.value = value
         self.behavior = behavior  # For REFERENCE tokens: 'required' (), 'optional' [], 'passthrough' {}
+        # For REFERENCE tokens without nested references: the value split on the
+        # tokenizing config's key delimiter, so evaluation needn't split it again
+        self.path = path
+        # For NUMBER tokens: the parsed int or float value
+        self.numeric = numeric
 
     def __repr__(self):
         if self.type == "REFERENCE" and hasattr(self, "behavior"):
@@ -128,6 +145,148 @@ class Token:
         return f"Token({self.type}, {self.value!r})"
 
 
+# Characters that end an undelimited reference such as ``$a.b``
+_REFERENCE_STOP_CHARS = frozenset("(),'\"+-*/%^<>=![]{}")
+# Characters after a comparison-like key delimiter that make it an operator
+_OPERATOR_CHARS = frozenset("=!<>(),'\"+-*/%^")
+
+
+@lru_cache(maxsize=32)
+def _reference_stop_chars(ref_indicator: str, key_delimiter: str) -> tuple:
+    """Return the stop characters for undelimited references under a config.
+
+    The key delimiter is removed so paths like ``$a.b`` keep going, and the
+    second item tells whether the delimiter can also be a comparison operator.
+    The third item matches a run of characters that need no special handling,
+    so they can be consumed in one step instead of classified one at a time.
+    """
+    stop_chars = (_REFERENCE_STOP_CHARS - {key_delimiter}) | frozenset(ref_indicator)
+    key_delim_is_cmp = key_delimiter in "<>="
+    special = set(stop_chars)
+    if key_delim_is_cmp:
+        special.add(key_delimiter)
+    plain_run = re.compile(
+        "[^%s\\s]+" % "".join(re.escape(c) for c in sorted(special))
+    ).match
+    return stop_chars, key_delim_is_cmp, plain_run
+
+
+@lru_cache(maxsize=32)
+def _token_scanner(ref_indicator: str) -> Callable:
+    """Build the regex matcher for tokens that don't need the tokenizer loop.
+
+    Leading whitespace is consumed with each token. Group names are token
+    types, except NAME (identifiers, keywords and function names); no group
+    matches for trailing whitespace. Nothing starting with ref_indicator is
+    matched, and numbers and names must not run into non-ASCII text (or a
+    second decimal point), so the loop can apply its unicode-aware rules.
+    """
+    pattern = r"""
+        \s*
+        (?:
+            \Z
+          | (?!{ref})
+            (?:
+                (?P<STRING>'[^'\\]*'|"[^"\\]*")
+              | (?P<NUMBER>[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?![^\x00-\x7f]|[0-9.])
+              | (?P<NAME>[A-Za-z_][A-Za-z0-9_]*)(?![^\x00-\x7f]|[A-Za-z0-9_])
+              | (?P<COMPARISON>==|!=|<=|>=|<|>)
+              | (?P<OPERATOR>[-+*/^%])
+              | (?P<LPAREN>\()
+              | (?P<RPAREN>\))
+              | (?P<COMMA>,)
+            )
+        )
+    """.format(ref=re.escape(ref_indicator))
+    return re.compile(pattern, re.VERBOSE).match
+
+
+# String literal bodies up to and including the closing quote, where a
+# backslash escapes any following character
+_STRING_BODY = {
+    quote: re.compile(rf"(?:[^{quote}\\]|\\.)*{quote}", re.DOTALL).match
+    for quote in "'\""
+}
+_unescape = re.compile(r"\\(.)", re.DOTALL).sub
+
+
+class _SharedToken(Token):
+    """A Token reused across tokenize() results, so it is read-only."""
+
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        self.__dict__.update(vars(Token(*args, **kwargs)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self!r} is shared and can't be modified")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self!r} is shared and can't be modified")
+
+
+# Tokens that don't depend on their position (keywords, operators,
+# delimiters, short numbers) are shared between expressions
+_KEYWORD_TOKENS = {
+    "True": _SharedToken("BOOLEAN", "True"),
+    "False": _SharedToken("BOOLEAN", "False"),
+    "and": _SharedToken("LOGICAL", "and"),
+    "or": _SharedToken("LOGICAL", "or"),
+    "not": _SharedToken("NOT", "not"),
+}
+
+_SHARED_TOKENS = {
+    value: _SharedToken(type_, value)
+    for type_, values in (
+        ("OPERATOR", ("+", "-", "*", "/", "^", "%")),
+        ("COMPARISON", ("==", "!=", "<=", ">=", "<", ">")),
+        ("LPAREN", ("(",)),
+        ("RPAREN", (")",)),
+        ("COMMA", (",",)),
+    )
+    for value in values
+}
+
+# Longest NUMBER literal added to _SHARED_TOKENS, which bounds its size
+_MAX_SHARED_NUMBER_LEN = 3
+
+
+def _shared_token(kind: str, value: str) -> Token:
+    """Token for an operator, delimiter or number, reusing shared instances."""
+    token = _SHARED_TOKENS.get(value)
+    if token is None:
+        if kind != "NUMBER":
+            return Token(kind, value)
+        if len(value) > _MAX_SHARED_NUMBER_LEN:
+            return _number_token(value)
+        token = _SHARED_TOKENS[value] = _number_token(value, _SharedToken)
+    return token
+
+
+def _number_token(text: str, token_class: type = Token) -> Token:
+    """NUMBER token for text, parsed as float if it has a decimal point."""
+    try:
+        numeric = float(text) if "." in text else int(text)
+    except ValueError:
+        # e.g. superscript digits; the error is raised if it is evaluated
+        numeric = None
+    return token_class("NUMBER", text, numeric=numeric)
+
+
+_CALL_LOOKAHEAD = re.compile(r"\s*\(").match
+
+
+def _name_token(name: str, expression: str, end: int) -> Token:
+    """Token for an identifier that ended at position end of expression."""
+    keyword = _KEYWORD_TOKENS.get(name)
+    if keyword is not None:
+        return keyword
+    # Look ahead to see if this is a function call
+    if _CALL_LOOKAHEAD(expression, end):
+        return Token("FUNCTION", name)
+    return Token("IDENTIFIER", name)
+
+
 def tokenize(expression: str, config: Optional[DRLConfig] = None) -> List[Token]:
     """Tokenize a DRL expression into tokens.
 
@@ -152,8 +311,26 @@ def tokenize(expression: str, config: Optional[DRLConfig] = None) -> List[Token]
     tokens = []
     i = 0
     original_expression = expression  # Keep for error reporting
+    # Read the syntax symbols once; everything derived from them is cached
+    ref_indicator = config.ref_indicator
+    key_delimiter = config.key_delimiter
+    scan = _token_scanner(ref_indicator)
 
     while i < len(expression):
+        # Common tokens are matched by a single compiled regex; references,
+        # escaped strings, non-ASCII text and errors use the loop below
+        match = scan(expression, i)
+        if match is not None:
+            kind = match.lastgroup
+            i = match.end()
+            if kind == "NAME":
+                tokens.append(_name_token(match.group(kind), expression, i))
+            elif kind == "STRING":
+                tokens.append(Token("STRING", match.group(kind)[1:-1]))
+            elif kind is not None:
+                tokens.append(_shared_token(kind, match.group(kind)))
+            continue
+
         # Skip whitespace
         if expression[i].isspace():
             i += 1
@@ -161,7 +338,7 @@ def tokenize(expression: str, config: Optional[DRLConfig] = None) -> List[Token]
 
         # Data reference: {ref_indicator}(path) or {ref_indicator}[path] or {ref_indicator}{path}
         # () = required (throw exception), [] = optional (return None), {} = passthrough (return original)
-        if expression[i] == config.ref_indicator:
+        if expression[i] == ref_indicator:
             ref_start = i
             i += 1  # Skip the $ character
 
@@ -215,19 +392,19 @@ def tokenize(expression: str, config: Optional[DRLConfig] = None) -> List[Token]
                 # Old-style reference without delimiters (for backward compatibility)
                 # Collect reference path (can include spaces in keys)
                 # Stop at operators, comparison operators, delimiters, and quotes
-                base_stop_chars = "(),'\"+-*/%^<>=![]{}"
-                # Remove key_delimiter from stop_chars if it's in there
-                stop_chars = "".join(
-                    c for c in base_stop_chars if c != config.key_delimiter
+                stop_chars, key_delim_is_cmp, plain_run = _reference_stop_chars(
+                    ref_indicator, key_delimiter
                 )
-                stop_chars += config.ref_indicator
 
                 while i < len(expression):
+                    run = plain_run(expression, i)
+                    if run is not None:
+                        ref += run.group()
+                        i = run.end()
+                        continue
+
                     # Special handling for key_delimiter when it might also be a comparison operator
-                    if (
-                        expression[i] == config.key_delimiter
-                        and config.key_delimiter in "<>="
-                    ):
+                    if key_delim_is_cmp and expression[i] == key_delimiter:
                         # Check if this is a comparison operator or a key delimiter
                         # It's a comparison operator if:
                         # 1. Followed by space, end of string, or another operator char (like = for >=)
@@ -237,7 +414,7 @@ def tokenize(expression: str, config: Optional[DRLConfig] = None) -> List[Token]
                             # End of expression, this is a comparison operator
                             break
                         next_char = expression[next_pos]
-                        if next_char.isspace() or next_char in "=!<>(),'\"+-*/%^":
+                        if next_char.isspace() or next_char in _OPERATOR_CHARS:
                             # This is a comparison operator, not a key delimiter
                             break
                         # Otherwise, it's a key delimiter, continue collecting the reference
@@ -260,19 +437,13 @@ def tokenize(expression: str, config: Optional[DRLConfig] = None) -> List[Token]
                                 break
 
                             # Check for comparison operators that might have been removed from stop_chars
-                            if (
-                                config.key_delimiter in "<>="
-                                and expression[j] == config.key_delimiter
-                            ):
+                            if key_delim_is_cmp and expression[j] == key_delimiter:
                                 # Peek ahead to see if it's a comparison operator
                                 next_pos = j + 1
                                 if next_pos >= len(expression):
                                     break
                                 next_char = expression[next_pos]
-                                if (
-                                    next_char.isspace()
-                                    or next_char in "=!<>(),'\"+-*/%^"
-                                ):
+                                if next_char.isspace() or next_char in _OPERATOR_CHARS:
                                     break
 
                             # Stop if next word is a logical keyword
@@ -297,65 +468,64 @@ def tokenize(expression: str, config: Optional[DRLConfig] = None) -> List[Token]
 
                     ref += expression[i]
                     i += 1
-            tokens.append(Token("REFERENCE", ref.strip(), behavior=behavior))
+            ref = ref.strip()
+            path = None
+            if ref_indicator not in ref:
+                # Interned keys let dict lookups match context keys by identity
+                path = tuple(
+                    sys.intern(part.strip()) for part in ref.split(key_delimiter)
+                )
+            tokens.append(Token("REFERENCE", ref, behavior=behavior, path=path))
             continue
 
         # String literal
         if expression[i] in "\"'":
             quote = expression[i]
             quote_start = i
-            i += 1
-            string = ""
-            while i < len(expression) and expression[i] != quote:
-                if expression[i] == "\\" and i + 1 < len(expression):
-                    # Handle escape sequences
-                    i += 1
-                    string += expression[i]
-                else:
-                    string += expression[i]
-                i += 1
-            if i >= len(expression):
+            body = _STRING_BODY[quote](expression, i + 1)
+            if body is None:
                 raise DRLSyntaxError(
                     f"Unterminated string literal starting with {quote}",
                     original_expression,
                     quote_start,
                     f"String started at position {quote_start} but never closed",
                 )
-            i += 1  # Skip closing quote
-            tokens.append(Token("STRING", string))
+            i = body.end()  # Just past the closing quote
+            # Handle escape sequences: a backslash keeps the next character
+            tokens.append(Token("STRING", _unescape(r"\1", body.group()[:-1])))
             continue
 
         # Delimiters
         if expression[i] == "(":
-            tokens.append(Token("LPAREN", "("))
+            tokens.append(_SHARED_TOKENS["("])
             i += 1
             continue
 
         if expression[i] == ")":
-            tokens.append(Token("RPAREN", ")"))
+            tokens.append(_SHARED_TOKENS[")"])
             i += 1
             continue
 
         if expression[i] == ",":
-            tokens.append(Token("COMMA", ","))
+            tokens.append(_SHARED_TOKENS[","])
             i += 1
             continue
 
         # Mathematical operators
         if expression[i] in "+-*/":
-            tokens.append(Token("OPERATOR", expression[i]))
+            tokens.append(_SHARED_TOKENS[expression[i]])
             i += 1
             continue
 
         # Power operator
         if expression[i] == "^":
-            tokens.append(Token("OPERATOR", "^"))
+            tokens.append(_SHARED_TOKENS["^"])
             i += 1
             continue
 
         # Modulo operator
         if expression[i] == "%":
-            tokens.append(Token("OPERATOR", "%"))
+            tokens.append(_SHARED_TOKENS["%"])
             i += 1
             continue
 
@@ -363,13 +533,13 @@ def tokenize(expression: str, config: Optional[DRLConfig] = None) -> List[Token]
         if i + 1 < len(expression):
             two_char = expression[i : i + 2]
             if two_char in ["==", "!=", "<=", ">="]:
-                tokens.append(Token("COMPARISON", two_char))
+                tokens.append(_SHARED_TOKENS[two_char])
                 i += 2
                 continue
 
         # Single-character comparison operators (< and >)
         if expression[i] in "<>":
-            tokens.append(Token("COMPARISON", expression[i]))
+            tokens.append(_SHARED_TOKENS[expression[i]])
             i += 1
             continue
 
@@ -398,7 +568,7 @@ def tokenize(expression: str, config: Optional[DRLConfig] = None) -> List[Token]
                     has_dot = True
                 num += expression[i]
                 i += 1
-            tokens.append(Token("NUMBER", num))
+            tokens.append(_shared_token("NUMBER", num))
             continue
 
         # Function name or bare identifier
@@ -410,19 +580,9 @@ def tokenize(expression: str, config: Optional[DRLConfig] = None) -> List[Token]
                 name += expression[i]
                 i += 1
 
-            # Check for boolean literals
-            if name == "True":
-                tokens.append(Token("BOOLEAN", "True"))
-                continue
-            elif name == "False":
-                tokens.append(Token("BOOLEAN", "False"))
-                continue
-            # Check for logical operators
-            elif name in ["and", "or"]:
-                tokens.append(Token("LOGICAL", name))
-                continue
-            elif name == "not":
-                tokens.append(Token("NOT", "not"))
+            # Check for boolean literals and logical operators
+            if name in _KEYWORD_TOKENS:
+                tokens.append(_KEYWORD_TOKENS[name])
                 continue
 
             # Look ahead to see if this is a function call
@@ -591,6 +751,107 @@ def resolve_nested_references_in_path(
     return result
 
 
+@lru_cache(maxsize=1024)
+def _nested_path_plan(
+    reference: str, ref_indicator: str, key_delimiter: str
+) -> Optional[tuple]:
+    """Split a reference path around its nested references, reusing earlier work.
+
+    Returns a tuple of literal path text and ``(nested_ref, behavior)`` pairs
+    in the order resolve_nested_references_in_path() substitutes them, or None
+    for paths it would reject or stop early on, which are left to it.
+    """
+    plan = []
+    pos = 0
+    while True:
+        start = reference.find(ref_indicator, pos)
+        if start == -1:
+            plan.append(reference[pos:])
+            break
+        plan.append(reference[pos:start])
+        i = start + len(ref_indicator)
+        if i >= len(reference):
+            return None
+
+        closing_delimiter = _REFERENCE_CLOSING.get(reference[i])
+        if closing_delimiter is None:
+            # Bare reference, ending at key_delimiter or another ref_indicator
+            end = i
+            while end < len(reference):
+                if reference.startswith(key_delimiter, end) or reference.startswith(
+                    ref_indicator, end
+                ):
+                    break
+                end += 1
+            plan.append((reference[i:end], "required"))
+            pos = end
+        else:
+            opening = reference[i]
+            i += 1
+            depth = 1
+            nested_start = i
+            while i < len(reference):
+                char = reference[i]
+                if char == closing_delimiter:
+                    depth -= 1
+                    if depth == 0:
+                        break
+                elif char == opening:
+                    depth += 1
+                i += 1
+            if depth > 0:
+                return None
+            plan.append((reference[nested_start:i], _REFERENCE_BEHAVIORS[opening]))
+            pos = i + 1
+
+    # resolve_nested_references_in_path() gives up after 100 substitutions
+    if len(plan) // 2 >= 100:
+        return None
+    return tuple(plan)
+
+
+_REFERENCE_CLOSING = {"(": ")", "[": "]", "{": "}"}
+_REFERENCE_BEHAVIORS = {"(": "required", "[": "optional", "{": "passthrough"}
+
+
+def _resolve_nested_path(
+    reference: str,
+    context: Dict[str, Any],
+    config: DRLConfig,
+    expression: str,
+    position: int,
+) -> str:
+    """Substitute nested references like resolve_nested_references_in_path().
+
+    The path is scanned once per syntax and cached by _nested_path_plan().
+    A nested value whose text shares a character with ref_indicator could
+    change how the rest of the path is rescanned, so the string-rewriting
+    resolver handles those.
+    """
+    plan = _nested_path_plan(reference, config.ref_indicator, config.key_delimiter)
+    if plan is None:
+        return resolve_nested_references_in_path(
+            reference, context, config, expression, position
+        )
+    parts = []
+    for piece in plan:
+        if type(piece) is str:
+            parts.append(piece)
+            continue
+        nested_ref, behavior = piece
+        value = str(
+            resolve_reference(
+                nested_ref, context, config, expression, position, behavior, ""
+            )
+        )
+        if any(char in value for char in config.ref_indicator):
+            return resolve_nested_references_in_path(
+                reference, context, config, expression, position
+            )
+        parts.append(value)
+    return "".join(parts)
+
+
 def resolve_reference(
     reference: str,
     context: Dict[str, Any],
@@ -625,19 +886,63 @@ def resolve_reference(
         config = DEFAULT_CONFIG
 
     # First, resolve any nested references in the path
-    reference = resolve_nested_references_in_path(
-        reference, context, config, expression, position
+    if config.ref_indicator in reference:
+        reference = _resolve_nested_path(
+            reference, context, config, expression, position
+        )
+
+    path = tuple(part.strip() for part in reference.split(config.key_delimiter))
+    return _resolve_path(
+        path, context, config, expression, position, behavior, original_ref
     )
 
-    parts = reference.split(config.key_delimiter)
+
+def _resolve_path(
+    path: tuple,
+    context: Dict[str, Any],
+    config: DRLConfig,
+    expression: str,
+    position: int,
+    behavior: str,
+    original_ref: str,
+) -> Any:
+    """Walk an already split reference path through context.
+
+    Same arguments, return value and errors as resolve_reference(), except that
+    path holds the stripped keys and contains no nested references.
+    """
+    # Fast path: plain dicts all the way down. Anything else (lists, missing
+    # keys, dict subclasses that may customize lookups) takes the full walk.
     value = context
-    path_so_far = []
+    for part in path:
+        if type(value) is not dict:
+            break
+        try:
+            value = value[part]
+        except KeyError:
+            break
+    else:
+        return value
+    return _walk_path(
+        path, context, config, expression, position, behavior, original_ref
+    )
 
-    for part in parts:
-        part = part.strip()
-        path_so_far.append(part)
 
-        if isinstance(value, dict):
+def _walk_path(
+    path: tuple,
+    context: Dict[str, Any],
+    config: DRLConfig,
+    expression: str,
+    position: int,
+    behavior: str,
+    original_ref: str,
+) -> Any:
+    """Walk path through context like _resolve_path, checking every step."""
+    value = context
+
+    for index, part in enumerate(path):
+        # Read-only mappings such as MappingProxyType navigate like dicts
+        if isinstance(value, Mapping):
             if part not in value:
                 if behavior == "optional":
                     return None  # Return None for optional references
@@ -654,25 +959,25 @@ def resolve_reference(
                     f"Reference key '{part}' not found in context",
                     expression,
                     position,
-                    f"Failed at: {config.key_delimiter.join(path_so_far)}\n  {key_hint}",
+                    f"Failed at: {config.key_delimiter.join(path[: index + 1])}\n  {key_hint}",
                 )
             value = value[part]
         elif isinstance(value, (list, tuple)):
             # Support list/tuple indexing with integer keys
             try:
-                index = int(part)
-                if -len(value) <= index < len(value):
-                    value = value[index]
+                list_index = int(part)
+                if -len(value) <= list_index < len(value):
+                    value = value[list_index]
                 else:
                     if behavior == "optional":
                         return None
                     elif behavior == "passthrough":
                         return original_ref
                     raise DRLReferenceError(
-                        f"List index {index} out of range",
+                        f"List index {list_index} out of range",
                         expression,
                         position,
-                        f"List at '{config.key_delimiter.join(path_so_far[:-1])}' has length {len(value)}",
+                        f"List at '{config.key_delimiter.join(path[:index])}' has length {len(value)}",
                     )
             except ValueError:
                 # Not an integer - can't index list with non-integer
@@ -684,7 +989,7 @@ def resolve_reference(
                     f"Cannot use non-integer key '{part}' to index {type(value).__name__}",
                     expression,
                     position,
-                    f"Value at '{config.key_delimiter.join(path_so_far[:-1])}' is a {type(value).__name__}, requires integer index",
+                    f"Value at '{config.key_delimiter.join(path[:index])}' is a {type(value).__name__}, requires integer index",
                 )
         else:
             if behavior == "optional":
@@ -696,12 +1001,97 @@ def resolve_reference(
                 f"Cannot navigate into non-dict/non-list value at key '{part}'",
                 expression,
                 position,
-                f"Value at '{config.key_delimiter.join(path_so_far[:-1])}' is {type(value).__name__}, not a dictionary or list",
+                f"Value at '{config.key_delimiter.join(path[:index])}' is {type(value).__name__}, not a dictionary or list",
             )
 
     return value
 
 
+class _Node(list):
+    """Base class for parsed expression nodes.
+
+    Nodes are lists so parse_line() output keeps its documented shape (e.g.
+    ['OPERATOR', '+', left, right]), while evaluate() dispatches on the node
+    class instead of comparing tag strings.
+    """
+
+    __slots__ = ()
+
+
+class OpNode(_Node):
+    """Arithmetic operation: ['OPERATOR', op, left, right]."""
+
+    __slots__ = ()
+
+
+class CmpNode(_Node):
+    """Comparison: ['COMPARISON', op, left, right]."""
+
+    __slots__ = ()
+
+
+class LogicNode(_Node):
+    """Logical and/or: ['LOGICAL', op, left, right]."""
+
+    __slots__ = ()
+
+
+class NotNode(_Node):
+    """Logical negation: ['NOT', operand]."""
+
+    __slots__ = ()
+
+
+class CallNode(_Node):
+    """Function call: [func_name, arg1, arg2, ...].
+
+    ``resolved`` caches ``(builtin, caller)`` for the builtin function the
+    name last resolved to, so evaluate() can skip dispatch on repeat calls.
+    """
+
+    __slots__ = ("resolved",)
+
+
+_TAGGED_NODES = {
+    "OPERATOR": (OpNode, 4),
+    "COMPARISON": (CmpNode, 4),
+    "LOGICAL": (LogicNode, 4),
+    "NOT": (NotNode, 2),
+}
+
+
+def _node_type(parsed: list) -> type:
+    """Node class for a tagged list, as evaluate() interprets it."""
+    node_type, length = _TAGGED_NODES.get(parsed[0], (CallNode, None))
+    if length is not None and len(parsed) != length:
+        # e.g. ['OPERATOR'] alone is a call to a function named OPERATOR
+        return CallNode
+    return node_type
+
+
+# Binary operators by (token type, value): (precedence, node class).
+# Lower number = higher precedence.
+_BINARY_OPERATORS = {
+    ("OPERATOR", "^"): (1, OpNode),  # Power
+    ("OPERATOR", "*"): (2, OpNode),
+    ("OPERATOR", "/"): (2, OpNode),
+    ("OPERATOR", "%"): (2, OpNode),  # Modulo
+    ("OPERATOR", "+"): (3, OpNode),
+    ("OPERATOR", "-"): (3, OpNode),
+    ("COMPARISON", "<"): (4, CmpNode),
+    ("COMPARISON", ">"): (4, CmpNode),
+    ("COMPARISON", "<="): (4, CmpNode),
+    ("COMPARISON", ">="): (4, CmpNode),
+    ("COMPARISON", "=="): (5, CmpNode),
+    ("COMPARISON", "!="): (5, CmpNode),
+    ("LOGICAL", "and"): (7, LogicNode),
+    ("LOGICAL", "or"): (8, LogicNode),
+}
+
+# Precedence of unary 'not', between equality and 'and'
+_NOT_PRECEDENCE = 6
+
+
 def parse_line(
     line: str, config: Optional[DRLConfig] = None
 ) -> Union[Token, List, None]:
@@ -716,6 +1106,9 @@ def parse_line(
     - Function calls are returned as nested lists: [function_name, arg1, arg2, ...]
     - Operator expressions: ['OPERATOR', operator, left, right]
 
+    Each list is a node class (CallNode, OpNode, CmpNode, LogicNode, NotNode)
+    so evaluate() can dispatch on its type.
+
     Raises:
         DRLSyntaxError: For syntax errors during parsing
     """
@@ -733,63 +1126,35 @@ def parse_line(
         if tokens[0].type in ("REFERENCE", "NUMBER", "BOOLEAN"):
             return tokens[0]
 
-    # Operator precedence (lower number = higher precedence)
-    precedence = {
-        "^": 1,  # Power
-        "*": 2,
-        "/": 2,
-        "%": 2,  # Modulo
-        "+": 3,
-        "-": 3,
-        "<": 4,  # Comparison operators
-        ">": 4,
-        "<=": 4,
-        ">=": 4,
-        "==": 5,
-        "!=": 5,
-        "not": 6,  # Logical not (unary)
-        "and": 7,  # Logical and
-        "or": 8,  # Logical or
-    }
-
     def parse_expression_with_precedence(tokens, start=0, min_precedence=999):
         """Parse expression with operator precedence."""
         # Handle unary 'not'
         if start < len(tokens) and tokens[start].type == "NOT":
             start += 1
             operand, start = parse_expression_with_precedence(
-                tokens, start, precedence.get("not", 6) + 1
+                tokens, start, _NOT_PRECEDENCE + 1
             )
-            left = ["NOT", operand]
+            left = NotNode(("NOT", operand))
         else:
             left, start = parse_primary(tokens, start)
 
         while start < len(tokens):
-            # Check if next token is an operator, comparison, or logical
-            token_type = tokens[start].type
-            if token_type in ["OPERATOR", "COMPARISON", "LOGICAL"]:
-                op = tokens[start].value
-                op_precedence = precedence.get(op, 999)
-
-                if op_precedence >= min_precedence:
-                    break
-
-                start += 1  # Consume operator
+            # Only operator, comparison and logical tokens continue the expression
+            token = tokens[start]
+            binary = _BINARY_OPERATORS.get((token.type, token.value))
+            if binary is None:
+                break
+            op_precedence, node_type = binary
+            if op_precedence >= min_precedence:
+                break
 
-                # Parse right side with higher precedence
-                right, start = parse_expression_with_precedence(
-                    tokens, start, op_precedence + 1
-                )
+            start += 1  # Consume operator
 
-                # Create operator node
-                if token_type == "COMPARISON":
-                    left = ["COMPARISON", op, left, right]
-                elif token_type == "LOGICAL":
-                    left = ["LOGICAL", op, left, right]
-                else:
-                    left = ["OPERATOR", op, left, right]
-            else:
-                break
+            # Parse right side with higher precedence
+            right, start = parse_expression_with_precedence(
+                tokens, start, op_precedence + 1
+            )
+            left = node_type((token.type, token.value, left, right))
 
         return left, start
 
@@ -857,13 +1222,142 @@ def parse_line(
                 )
             start += 1
 
-            return [func_name] + args, start
+            return CallNode([func_name, *args]), start
 
         # Simple value (reference, string, number, or identifier)
         return token, start + 1
 
     result, _ = parse_expression_with_precedence(tokens)
-    return result
+    return _bind_constant_patterns(_fold_constants(result))
+
+
+# Leaf token types each kind of node may be folded over. Arithmetic is limited
+# to numbers and booleans so folding never builds large strings at parse time.
+_FOLDABLE_LEAVES = {
+    "OPERATOR": ("NUMBER", "BOOLEAN"),
+    "COMPARISON": ("NUMBER", "BOOLEAN", "STRING"),
+    "LOGICAL": ("NUMBER", "BOOLEAN", "STRING"),
+    "NOT": ("NUMBER", "BOOLEAN", "STRING"),
+}
+
+# Largest exponent (and base) folded for '^', to keep parse time bounded
+_MAX_FOLDED_EXPONENT = 64
+
+
+def _fold_constants(parsed):
+    """Collapse operator subtrees whose operands are all literals into a Token.
+
+    Subtrees containing references, identifiers or function calls are left
+    alone, as are operations that fail (e.g. division by zero) so their
+    errors are still raised when the expression is evaluated.
+    """
+    if not isinstance(parsed, list) or not parsed:
+        return parsed
+
+    kind = parsed[0]
+    leaf_types = _FOLDABLE_LEAVES.get(kind) if isinstance(kind, str) else None
+    if leaf_types is None or len(parsed) != (2 if kind == "NOT" else 4):
+        # Function call (or unknown node): fold its arguments only
+        for i in range(1, len(parsed)):
+            parsed[i] = _fold_constants(parsed[i])
+        return parsed
+
+    first_operand = 1 if kind == "NOT" else 2
+    for i in range(first_operand, len(parsed)):
+        parsed[i] = _fold_constants(parsed[i])
+    operands = parsed[first_operand:]
+    if not all(
+        isinstance(operand, Token) and operand.type in leaf_types
+        for operand in operands
+    ):
+        return parsed
+
+    if kind == "OPERATOR" and parsed[1] == "^":
+        base, exponent = evaluate(operands[0], {}), evaluate(operands[1], {})
+        if abs(exponent) > _MAX_FOLDED_EXPONENT or abs(base) > 2**64:
+            return parsed
+
+    try:
+        value = evaluate(parsed, {})
+    except Exception:
+        return parsed
+
+    if isinstance(value, bool):
+        return Token("BOOLEAN", str(value))
+    if isinstance(value, int):
+        return Token("NUMBER", str(value), numeric=value)
+    if isinstance(value, float):
+        # Only fold floats that read back exactly as a NUMBER token would
+        text = repr(value)
+        if "." in text and "e" not in text and float(text) == value:
+            return Token("NUMBER", text, numeric=value)
+    return parsed
+
+
+class _PatternCall(CallNode):
+    """Function-call node whose constant pattern argument was bound at parse time.
+
+    Behaves exactly like a plain CallNode; ``bound`` holds
+    the specialized callable for the remaining arguments and ``builtin`` the
+    function it was derived from, so evaluate() can tell if it was overridden.
+    """
+
+    __slots__ = ("builtin", "bound")
+
+
+def _bind_constant_patterns(parsed):
+    """Replace regex calls with a string-literal pattern by _PatternCall nodes."""
+    if not isinstance(parsed, list) or not parsed:
+        return parsed
+    for i in range(1, len(parsed)):
+        parsed[i] = _bind_constant_patterns(parsed[i])
+    func_name = parsed[0]
+    if (
+        len(parsed) > 1
+        and isinstance(func_name, str)
+        and func_name.startswith("regex_")
+        and isinstance(parsed[1], Token)
+        and parsed[1].type == "STRING"
+    ):
+        builtin = functions.FUNCTIONS.get(func_name)
+        bound = functions.bind_pattern(builtin, parsed[1].value) if builtin else None
+        if bound is not None:
+            node = _PatternCall(parsed)
+            node.builtin = builtin
+            node.bound = bound
+            return node
+    return parsed
+
+
+_ARITHMETIC_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "^": operator.pow,
+}
+
+# Operators that reject a zero right operand: (message, hint)
+_ZERO_DIVISOR_ERRORS = {
+    "/": ("Division by zero", "Cannot divide by zero"),
+    "%": ("Modulo by zero", "Cannot perform modulo with zero divisor"),
+}
+
+
+_COMPARISON_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+
+# Truth value of the left operand that decides a logical operation on its
+# own, in which case the right operand is never evaluated
+_SHORT_CIRCUIT_ON = {"and": False, "or": True}
 
 
 def evaluate(
@@ -898,12 +1392,19 @@ def evaluate(
             behavior = getattr(parsed, "behavior", "required")
             # Construct original reference string for passthrough behavior
             original_ref = f"{config.ref_indicator}{parsed.value}"
+            path = getattr(parsed, "path", None)
+            if path is not None:
+                return _resolve_path(
+                    path, context, config, expression, -1, behavior, original_ref
+                )
             return resolve_reference(
                 parsed.value, context, config, expression, -1, behavior, original_ref
             )
         elif parsed.type == "STRING":
             return parsed.value
         elif parsed.type == "NUMBER":
+            if parsed.numeric is not None:
+                return parsed.numeric
             # Parse as float if it has a decimal point, otherwise int
             if "." in parsed.value:
                 return float(parsed.value)
@@ -921,210 +1422,989 @@ def evaluate(
                 f"Token with value '{parsed.value}' has unexpected type",
             )
 
-    # Handle function call or operator (list)
-    if isinstance(parsed, list) and len(parsed) > 0:
-        if isinstance(parsed[0], str):
-            # Operator expression: ['OPERATOR', op, left, right]
-            if parsed[0] == "OPERATOR" and len(parsed) == 4:
-                operator = parsed[1]
-                try:
-                    left = evaluate(parsed[2], context, config, expression)
-                    right = evaluate(parsed[3], context, config, expression)
-                except (TypeError, ValueError):
-                    try:
-                        left = evaluate(parsed[2], context, config, expression)
-                    except Exception as e:
-                        raise DRLTypeError(
-                            f"Error evaluating left operand: {str(e)}",
-                            expression,
-                            -1,
-                            "Left operand evaluation failed",
-                        )
+    # Handle parsed nodes, dispatching on node type
+    handler = _EVALUATORS.get(type(parsed))
+    if handler is None:
+        if not (isinstance(parsed, list) and parsed and isinstance(parsed[0], str)):
+            # Return as-is if we can't evaluate
+            return parsed
+        # Plain tagged list built outside parse_line
+        handler = _EVALUATORS[_node_type(parsed)]
+    return handler(parsed, context, config, expression)
 
-                    try:
-                        right = evaluate(parsed[3], context, config, expression)
-                    except Exception as e:
-                        raise DRLTypeError(
-                            f"Error evaluating right operand: {str(e)}",
-                            expression,
-                            -1,
-                            "Right operand evaluation failed",
-                        )
 
-                    raise DRLTypeError(
-                        f"Type error in operation: {left} {operator} {right}",
-                        expression,
-                        -1,
-                        f"Cannot perform '{operator}' on {type(left).__name__} and {type(right).__name__}",
-                    )
+def _evaluate_operator(parsed, context, config, expression):
+    """Evaluate ['OPERATOR', op, left, right]."""
+    operator = parsed[1]
+    try:
+        left = evaluate(parsed[2], context, config, expression)
+        right = evaluate(parsed[3], context, config, expression)
+    except (TypeError, ValueError):
+        try:
+            left = evaluate(parsed[2], context, config, expression)
+        except Exception as e:
+            raise DRLTypeError(
+                f"Error evaluating left operand: {str(e)}",
+                expression,
+                -1,
+                "Left operand evaluation failed",
+            )
 
-                # Perform the operation
-                if operator == "+":
-                    return left + right
-                elif operator == "-":
-                    return left - right
-                elif operator == "*":
-                    return left * right
-                elif operator == "/":
-                    if right == 0:
-                        raise DRLTypeError(
-                            "Division by zero", expression, -1, "Cannot divide by zero"
-                        )
-                    return left / right
-                elif operator == "%":
-                    if right == 0:
-                        raise DRLTypeError(
-                            "Modulo by zero",
-                            expression,
-                            -1,
-                            "Cannot perform modulo with zero divisor",
-                        )
-                    return left % right
-                elif operator == "^":
-                    return left**right
-                else:
-                    raise DRLSyntaxError(
-                        f"Unknown operator: {operator}",
-                        expression,
-                        -1,
-                        f"The operator '{operator}' is not supported",
-                    )
+        try:
+            right = evaluate(parsed[3], context, config, expression)
+        except Exception as e:
+            raise DRLTypeError(
+                f"Error evaluating right operand: {str(e)}",
+                expression,
+                -1,
+                "Right operand evaluation failed",
+            )
 
-            # Comparison expression: ['COMPARISON', op, left, right]
-            elif parsed[0] == "COMPARISON" and len(parsed) == 4:
-                operator = parsed[1]
-                left = evaluate(parsed[2], context, config, expression)
-                right = evaluate(parsed[3], context, config, expression)
-
-                # Perform comparison
-                if operator == "==":
-                    return left == right
-                elif operator == "!=":
-                    return left != right
-                elif operator == "<":
-                    return left < right
-                elif operator == ">":
-                    return left > right
-                elif operator == "<=":
-                    return left <= right
-                elif operator == ">=":
-                    return left >= right
-                else:
-                    raise DRLSyntaxError(
-                        f"Unknown comparison operator: {operator}",
-                        expression,
-                        -1,
-                        f"The comparison operator '{operator}' is not supported",
-                    )
+        raise DRLTypeError(
+            f"Type error in operation: {left} {operator} {right}",
+            expression,
+            -1,
+            f"Cannot perform '{operator}' on {type(left).__name__} and {type(right).__name__}",
+        )
 
-            # Logical expression: ['LOGICAL', op, left, right]
-            elif parsed[0] == "LOGICAL" and len(parsed) == 4:
-                operator = parsed[1]
-                left = evaluate(parsed[2], context, config, expression)
-                right = evaluate(parsed[3], context, config, expression)
-
-                # Perform logical operation
-                if operator == "and":
-                    return left and right
-                elif operator == "or":
-                    return left or right
-                else:
-                    raise DRLSyntaxError(
-                        f"Unknown logical operator: {operator}",
-                        expression,
-                        -1,
-                        f"The logical operator '{operator}' is not supported",
-                    )
+    # Perform the operation
+    apply = _ARITHMETIC_OPERATORS.get(operator)
+    if apply is None:
+        raise DRLSyntaxError(
+            f"Unknown operator: {operator}",
+            expression,
+            -1,
+            f"The operator '{operator}' is not supported",
+        )
+    zero_error = _ZERO_DIVISOR_ERRORS.get(operator)
+    if zero_error is not None and right == 0:
+        raise DRLTypeError(zero_error[0], expression, -1, zero_error[1])
+    return apply(left, right)
+
+
+def _evaluate_comparison(parsed, context, config, expression):
+    """Evaluate ['COMPARISON', op, left, right]."""
+    operator = parsed[1]
+    left = evaluate(parsed[2], context, config, expression)
+    right = evaluate(parsed[3], context, config, expression)
+
+    # Perform comparison
+    compare = _COMPARISON_OPERATORS.get(operator)
+    if compare is not None:
+        return compare(left, right)
+    raise DRLSyntaxError(
+        f"Unknown comparison operator: {operator}",
+        expression,
+        -1,
+        f"The comparison operator '{operator}' is not supported",
+    )
 
-            # Unary not: ['NOT', operand]
-            elif parsed[0] == "NOT" and len(parsed) == 2:
-                operand = evaluate(parsed[1], context, config, expression)
-                return not operand
 
-            # Function call: [func_name, arg1, arg2, ...]
-            else:
-                func_name = parsed[0]
-                try:
-                    args = [
-                        evaluate(arg, context, config, expression) for arg in parsed[1:]
-                    ]
-                except Exception as e:
-                    # Re-raise DRL errors as-is
-                    if isinstance(e, DRLError):
-                        raise
-                    # Wrap other errors
-                    raise DRLTypeError(
-                        f"Error evaluating argument for function '{func_name}': {str(e)}",
-                        expression,
-                        -1,
-                        f"Function: {func_name}",
-                    )
+def _evaluate_logical(parsed, context, config, expression):
+    """Evaluate ['LOGICAL', op, left, right]."""
+    operator = parsed[1]
+    short_circuit_on = _SHORT_CIRCUIT_ON.get(operator)
+    if short_circuit_on is None:
+        raise DRLSyntaxError(
+            f"Unknown logical operator: {operator}",
+            expression,
+            -1,
+            f"The logical operator '{operator}' is not supported",
+        )
 
-                # Use the execute function from functions module to handle function calls
-                # This uses the FUNCTIONS registry and handles type conversion
-                # Pass config to access custom functions
-                try:
-                    return functions.execute(func_name, *args, config=config)
-                except NameError as e:
-                    raise DRLNameError(
-                        str(e),
-                        expression,
-                        -1,
-                        f"Function '{func_name}' is not defined. Check spelling or register as custom function.",
-                    )
-                except Exception as e:
-                    # Re-raise DRL errors as-is
-                    if isinstance(e, DRLError):
-                        raise
-                    raise DRLTypeError(
-                        f"Error executing function '{func_name}': {str(e)}",
-                        expression,
-                        -1,
-                        f"Function: {func_name}, Arguments: {args}",
-                    )
+    # Only evaluate the right side if the left doesn't decide the result
+    left = evaluate(parsed[2], context, config, expression)
+    if bool(left) is short_circuit_on:
+        return left
+    return evaluate(parsed[3], context, config, expression)
 
-    # Return as-is if we can't evaluate
-    return parsed
 
+def _evaluate_not(parsed, context, config, expression):
+    """Evaluate ['NOT', operand]."""
+    return not evaluate(parsed[1], context, config, expression)
+
+
+def _evaluate_call(parsed, context, config, expression):
+    """Evaluate [func_name, arg1, arg2, ...]."""
+    func_name = parsed[0]
+    prebound = _is_prebound(parsed, config)
+    try:
+        args = [
+            evaluate(arg, context, config, expression)
+            for arg in parsed[2 if prebound else 1 :]
+        ]
+    except Exception as e:
+        _raise_argument_error(func_name, e, expression)
+
+    if (
+        not prebound
+        and type(parsed) is CallNode
+        and func_name not in config.custom_functions
+    ):
+        builtin = functions.FUNCTIONS.get(func_name)
+        if builtin is not None:
+            resolved = getattr(parsed, "resolved", None)
+            if resolved is None or resolved[0] is not builtin:
+                resolved = parsed.resolved = (builtin, functions.direct_caller(builtin))
+            try:
+                return resolved[1](*args)
+            except Exception as e:
+                _raise_call_error(func_name, e, args, expression)
+    return _call_function(parsed, args, prebound, config, expression)
+
+
+_EVALUATORS = {
+    OpNode: _evaluate_operator,
+    CmpNode: _evaluate_comparison,
+    LogicNode: _evaluate_logical,
+    NotNode: _evaluate_not,
+    CallNode: _evaluate_call,
+    _PatternCall: _evaluate_call,
+}
 
-def interpret(
-    line: str, context: Dict[str, Any], config: Optional[DRLConfig] = None
-) -> Any:
-    """Interpret a DRL expression against a context dictionary.
+
+def compile_expr(
+    parsed, expression: str = ""
+) -> Callable[[Dict[str, Any], DRLConfig], Any]:
+    """Compile a parsed DRL expression into a closure.
+
+    The node dispatch done by evaluate() happens once here, so evaluating the
+    result is a plain chain of Python calls. Functions are still resolved when
+    the closure runs, so custom and global registrations are honored.
 
     Args:
-        line: The DRL expression string
-        context: The data dictionary to resolve references from
-        config: Optional DRLConfig for custom syntax symbols (ref_indicator, key_delimiter)
+        parsed: Result from parse_line()
+        expression: The original expression (for error reporting)
 
     Returns:
-        The result of evaluating the expression
-
-    Raises:
-        DRLSyntaxError: For syntax errors in the expression
-        DRLReferenceError: If a reference path cannot be resolved
-        DRLNameError: If a function is not found
-        DRLTypeError: For type-related errors
+        Callable taking (context, config) that returns the same result as
+        evaluate(parsed, context, config, expression). config must not be None.
 
     Examples:
-        >>> interpret('$root>timestamp', {'root': {'timestamp': 1234}})
-        1234
-        >>> interpret('split($data>names, ",")', {'data': {'names': 'a,b,c'}})
-        ['a', 'b', 'c']
-        >>> interpret('2 + 3 * 4', {})
-        14
-        >>> interpret('$value * 2 + 10', {'value': 5})
-        20
-        >>> # Using custom symbols
-        >>> interpret('@root.timestamp', {'root': {'timestamp': 1234}}, DRLConfig('@', '.'))
-        1234
+        >>> compile_expr(parse_line('$x * 2'))({'x': 21}, DEFAULT_CONFIG)
+        42
     """
-    if config is None:
-        config = DEFAULT_CONFIG
+    return _compile_node(parsed, expression, fuse=True)
 
+
+def _compile_node(parsed, expression: str, fuse: bool) -> Callable:
+    """compile_expr(), optionally fusing operator subtrees into one function.
+
+    With fuse set, the largest subtrees _generate_fused() accepts run as a
+    single generated function; whenever that can't give the same result as
+    the closures (a failed lookup, a zero divisor, any error), the closures
+    run instead and produce the result or error.
+    """
+    if isinstance(parsed, Token):
+        return _compile_token(parsed, expression)
+
+    if isinstance(parsed, list) and len(parsed) > 0 and isinstance(parsed[0], str):
+        kind = parsed[0]
+        if fuse and (kind in _FUSED_KINDS or kind in _PURE_FUNCTIONS):
+            fast = _generate_fused(parsed)
+            if fast is not None:
+                return _with_fallback(fast, _compile_node(parsed, expression, False))
+        if kind == "OPERATOR" and len(parsed) == 4:
+            return _compile_operator(
+                parsed[1],
+                _compile_node(parsed[2], expression, fuse),
+                _compile_node(parsed[3], expression, fuse),
+                expression,
+            )
+        if kind == "COMPARISON" and len(parsed) == 4:
+            return _compile_comparison(
+                parsed[1],
+                _compile_node(parsed[2], expression, fuse),
+                _compile_node(parsed[3], expression, fuse),
+                expression,
+            )
+        if kind == "LOGICAL" and len(parsed) == 4:
+            return _compile_logical(
+                parsed[1],
+                _compile_node(parsed[2], expression, fuse),
+                _compile_node(parsed[3], expression, fuse),
+                expression,
+            )
+        if kind == "NOT" and len(parsed) == 2:
+            operand = _compile_node(parsed[1], expression, fuse)
+            return lambda context, config: not operand(context, config)
+        return _compile_call(parsed, expression)
+
+    # Return as-is if we can't evaluate
+    return _constant(parsed)
+
+
+def _constant(value: Any) -> Callable:
+    def constant(context, config):
+        return value
+
+    # Lets callers recognise context-free operands at compile time
+    constant.value = value
+    return constant
+
+
+def _raise_at_runtime(error: DRLError) -> Callable:
+    """Defer an evaluation error until the compiled expression runs."""
+
+    def fail(context, config):
+        raise error
+
+    return fail
+
+
+def _compile_token(token: Token, expression: str) -> Callable:
+    if token.type == "REFERENCE":
+        value = token.value
+        behavior = getattr(token, "behavior", "required")
+        path = getattr(token, "path", None)
+
+        if path is not None:
+            return _compile_path(path, value, behavior, expression)
+
+        def reference(context, config):
+            original_ref = f"{config.ref_indicator}{value}"
+            return resolve_reference(
+                value, context, config, expression, -1, behavior, original_ref
+            )
+
+        return reference
+    elif token.type in ("STRING", "IDENTIFIER"):
+        return _constant(token.value)
+    elif token.type == "NUMBER":
+        if token.numeric is not None:
+            return _constant(token.numeric)
+        # Parse as float if it has a decimal point, otherwise int
+        if "." in token.value:
+            return _constant(float(token.value))
+        return _constant(int(token.value))
+    elif token.type == "BOOLEAN":
+        return _constant(token.value == "True")
+    return _raise_at_runtime(
+        DRLSyntaxError(
+            f"Cannot evaluate token type: {token.type}",
+            expression,
+            -1,
+            f"Token with value '{token.value}' has unexpected type",
+        )
+    )
+
+
+def _compile_path(path: tuple, value: str, behavior: str, expression: str) -> Callable:
+    """Generate a straight-line lookup for a split reference path.
+
+    The generated function indexes plain dicts one key after another, as the
+    fast path of _resolve_path() does without the loop; anything else falls
+    back to _walk_path() with the usual errors.
+    """
+    namespace = {
+        "_walk_path": _walk_path,
+        "path": path,
+        "value": value,
+        "behavior": behavior,
+        "expression": expression,
+    }
+    lines = ["def split_reference(context, config):", "    v = context"]
+    if path:
+        lines.append("    try:")
+        for i, part in enumerate(path):
+            namespace[f"p{i}"] = part
+            indent = "    " * (i + 2)
+            lines.append(f"{indent}if type(v) is dict:")
+            lines.append(f"{indent}    v = v[p{i}]")
+        lines.append(f"{indent}    return v")
+        lines.append("    except KeyError:")
+        lines.append("        pass")
+    else:
+        lines.append("    return v")
+    lines.append(
+        "    return _walk_path(path, context, config, expression, -1, behavior,"
+        ' f"{config.ref_indicator}{value}")'
+    )
+    exec(compile("\n".join(lines), "<drl>", "exec"), namespace)
+    return namespace["split_reference"]
+
+
+def _compile_operator(
+    op: str, left_fn: Callable, right_fn: Callable, expression: str
+) -> Callable:
+    if op not in _ARITHMETIC_OPERATORS:
+        return _raise_at_runtime(
+            DRLSyntaxError(
+                f"Unknown operator: {op}",
+                expression,
+                -1,
+                f"The operator '{op}' is not supported",
+            )
+        )
+    apply = _ARITHMETIC_OPERATORS[op]
+    zero_error = _ZERO_DIVISOR_ERRORS.get(op)
+
+    def arithmetic(context, config):
+        try:
+            left = left_fn(context, config)
+            right = right_fn(context, config)
+        except (TypeError, ValueError):
+            _raise_operand_error(op, left_fn, right_fn, context, config, expression)
+        if zero_error is not None and right == 0:
+            raise DRLTypeError(zero_error[0], expression, -1, zero_error[1])
+        return apply(left, right)
+
+    return arithmetic
+
+
+def _with_fallback(fast: Callable, slow: Callable) -> Callable:
+    def fused(context, config):
+        try:
+            return fast(context, config)
+        except Exception:
+            return slow(context, config)
+
+    return fused
+
+
+class _SlowPath(Exception):
+    """Raised by generated code to hand over to the compiled closures."""
+
+
+# Node kinds _generate_fused() may accept at the root of a subtree
+_FUSED_KINDS = frozenset({"OPERATOR", "COMPARISON", "LOGICAL", "NOT"})
+
+# Python spelling of each operator in generated code
+_PYTHON_OPERATORS = {
+    ("OPERATOR", "+"): "+",
+    ("OPERATOR", "-"): "-",
+    ("OPERATOR", "*"): "*",
+    ("OPERATOR", "/"): "/",
+    ("OPERATOR", "%"): "%",
+    ("OPERATOR", "^"): "**",
+    ("COMPARISON", "=="): "==",
+    ("COMPARISON", "!="): "!=",
+    ("COMPARISON", "<"): "<",
+    ("COMPARISON", ">"): ">",
+    ("COMPARISON", "<="): "<=",
+    ("COMPARISON", ">="): ">=",
+}
+
+
+def _generate_fused(parsed: list) -> Optional[Callable]:
+    """Generate one Python function evaluating an expression tree.
+
+    Returns a function of (context, config), or None if the tree holds
+    anything but operators, comparisons, and/or/not, calls to _PURE_FUNCTIONS,
+    constants and split references. The generated code walks the whole tree
+    in a single frame and follows the closures step by step: operands are
+    evaluated left to right, and/or short circuit, references only walk dicts
+    and in-range list indexes, functions are only called while their name
+    still resolves to the builtin, and zero divisors are left to the closures;
+    every other case raises _SlowPath. Only side-effect-free functions are
+    inlined since the closures may run again after a _SlowPath.
+    """
+    lines = []
+    namespace = {"_SlowPath": _SlowPath, "_FUNCTIONS": functions.FUNCTIONS}
+    indent = ""
+
+    def name_for(value):
+        name = f"c{len(namespace)}"
+        namespace[name] = value
+        return name
+
+    def add(line):
+        lines.append(indent + line)
+
+    def emit(node):
+        nonlocal indent
+        if isinstance(node, Token):
+            if node.type == "REFERENCE":
+                if node.path is None:
+                    return None
+                temp = f"t{len(lines)}"
+                add(f"{temp} = ctx")
+                for part in node.path:
+                    key = name_for(part)
+                    add(f"if isinstance({temp}, dict) and {key} in {temp}:")
+                    add(f"    {temp} = {temp}[{key}]")
+                    try:
+                        index = int(part)
+                    except ValueError:
+                        pass
+                    else:
+                        add(
+                            f"elif isinstance({temp}, (list, tuple)) and "
+                            f"-len({temp}) <= {index} < len({temp}):"
+                        )
+                        add(f"    {temp} = {temp}[{index}]")
+                    add("else:")
+                    add("    raise _SlowPath")
+                return temp
+            constant = _compile_token(node, "")
+            if not hasattr(constant, "value"):
+                return None
+            return name_for(constant.value)
+
+        if not isinstance(node, list) or not node or not isinstance(node[0], str):
+            return None
+        kind = node[0]
+        if _node_type(node) is CallNode and not isinstance(node, _PatternCall):
+            builtin = functions.FUNCTIONS.get(kind)
+            if kind not in _PURE_FUNCTIONS or builtin is None:
+                return None
+            name = name_for(kind)
+            add(
+                f"if {name} in cfg.custom_functions or "
+                f"_FUNCTIONS.get({name}) is not {name_for(builtin)}:"
+            )
+            add("    raise _SlowPath")
+            args = []
+            for arg in node[1:]:
+                args.append(emit(arg))
+                if args[-1] is None:
+                    return None
+            temp = f"t{len(lines)}"
+            call = name_for(functions.direct_caller(builtin))
+            add(f"{temp} = {call}({', '.join(args)})")
+            return temp
+        if kind == "NOT" and len(node) == 2:
+            operand = emit(node[1])
+            if operand is None:
+                return None
+            temp = f"t{len(lines)}"
+            add(f"{temp} = not {operand}")
+            return temp
+        if len(node) != 4:
+            return None
+        if kind == "LOGICAL" and node[1] in _SHORT_CIRCUIT_ON:
+            left = emit(node[2])
+            if left is None:
+                return None
+            temp = f"t{len(lines)}"
+            add(f"{temp} = {left}")
+            add(f"if {'not ' if node[1] == 'or' else ''}{temp}:")
+            outer = indent
+            indent += "    "
+            right = emit(node[3])
+            if right is None:
+                return None
+            add(f"{temp} = {right}")
+            indent = outer
+            return temp
+        python_op = _PYTHON_OPERATORS.get((kind, node[1]))
+        if python_op is None:
+            return None
+        left = emit(node[2])
+        if left is None:
+            return None
+        right = emit(node[3])
+        if right is None:
+            return None
+        if kind == "OPERATOR" and node[1] in _ZERO_DIVISOR_ERRORS:
+            add(f"if {right} == 0:")
+            add("    raise _SlowPath")
+        temp = f"t{len(lines)}"
+        add(f"{temp} = {left} {python_op} {right}")
+        return temp
+
+    result = emit(parsed)
+    if result is None:
+        return None
+    body = "".join(f"    {line}\n" for line in lines)
+    source = f"def fused(ctx, cfg):\n{body}    return {result}\n"
+    exec(compile(source, "<drl>", "exec"), namespace)
+    return namespace["fused"]
+
+
+def _raise_operand_error(
+    op: str,
+    left_fn: Callable,
+    right_fn: Callable,
+    context: Dict[str, Any],
+    config: DRLConfig,
+    expression: str,
+):
+    """Re-evaluate the operands of a failed operation to report which one failed."""
+    try:
+        left = left_fn(context, config)
+    except Exception as e:
+        raise DRLTypeError(
+            f"Error evaluating left operand: {str(e)}",
+            expression,
+            -1,
+            "Left operand evaluation failed",
+        )
+
+    try:
+        right = right_fn(context, config)
+    except Exception as e:
+        raise DRLTypeError(
+            f"Error evaluating right operand: {str(e)}",
+            expression,
+            -1,
+            "Right operand evaluation failed",
+        )
+
+    raise DRLTypeError(
+        f"Type error in operation: {left} {op} {right}",
+        expression,
+        -1,
+        f"Cannot perform '{op}' on {type(left).__name__} and {type(right).__name__}",
+    )
+
+
+def _compile_comparison(
+    op: str, left_fn: Callable, right_fn: Callable, expression: str
+) -> Callable:
+    if op not in _COMPARISON_OPERATORS:
+        return _raise_at_runtime(
+            DRLSyntaxError(
+                f"Unknown comparison operator: {op}",
+                expression,
+                -1,
+                f"The comparison operator '{op}' is not supported",
+            )
+        )
+    compare = _COMPARISON_OPERATORS[op]
+    return lambda context, config: compare(
+        left_fn(context, config), right_fn(context, config)
+    )
+
+
+def _compile_logical(
+    op: str, left_fn: Callable, right_fn: Callable, expression: str
+) -> Callable:
+    if op == "and":
+
+        def logical_and(context, config):
+            return left_fn(context, config) and right_fn(context, config)
+
+        return logical_and
+    elif op == "or":
+
+        def logical_or(context, config):
+            return left_fn(context, config) or right_fn(context, config)
+
+        return logical_or
+    return _raise_at_runtime(
+        DRLSyntaxError(
+            f"Unknown logical operator: {op}",
+            expression,
+            -1,
+            f"The logical operator '{op}' is not supported",
+        )
+    )
+
+
+def _compile_call(parsed: list, expression: str) -> Callable:
+    func_name = parsed[0]
+    arg_fns = [compile_expr(arg, expression) for arg in parsed[1:]]
+    # Prebound regex calls already carry their constant pattern argument
+    bound_arg_fns = arg_fns[1:]
+
+    # Resolve the builtin now; it is used while the name still refers to it
+    builtin = functions.FUNCTIONS.get(func_name)
+    direct = None if builtin is None else functions.direct_caller(builtin)
+
+    def call(context, config):
+        prebound = _is_prebound(parsed, config)
+        try:
+            args = [
+                fn(context, config) for fn in (bound_arg_fns if prebound else arg_fns)
+            ]
+        except Exception as e:
+            _raise_argument_error(func_name, e, expression)
+        if (
+            direct is not None
+            and not prebound
+            and func_name not in config.custom_functions
+            and functions.FUNCTIONS.get(func_name) is builtin
+        ):
+            try:
+                return direct(*args)
+            except Exception as e:
+                _raise_call_error(func_name, e, args, expression)
+        return _call_function(parsed, args, prebound, config, expression)
+
+    if func_name in _PURE_FUNCTIONS and all(hasattr(fn, "value") for fn in arg_fns):
+        return _compile_pure_call(func_name, call)
+    if func_name in _PIPELINE_STAGES:
+        pipeline = _compile_pipeline(parsed, call, expression)
+        if pipeline is not None:
+            return pipeline
+    return call
+
+
+# Builtins whose result depends only on their arguments and is immutable, so a
+# call with literal arguments can be computed once and reused.
+_PURE_FUNCTIONS = frozenset(
+    {
+        "int",
+        "float",
+        "str",
+        "bool",
+        "len",
+        "max",
+        "min",
+        "upper",
+        "lower",
+        "capitalize",
+        "strip",
+        "replace",
+        "find",
+    }
+)
+
+
+def _compile_pure_call(func_name: str, call: Callable) -> Callable:
+    """Memoize a pure builtin call whose arguments are all literals.
+
+    The cached result is only reused while ``func_name`` still resolves to the
+    builtin seen at compile time; overridden or custom functions always run.
+    """
+    builtin = functions.FUNCTIONS.get(func_name)
+    result = []
+
+    def pure_call(context, config):
+        if (
+            config.custom_functions.get(func_name) is not None
+            or functions.FUNCTIONS.get(func_name) is not builtin
+        ):
+            return call(context, config)
+        if not result:
+            result.append(call(context, config))
+        return result[0]
+
+    return pure_call
+
+
+# List builtins _compile_pipeline() fuses, and the operand names their
+# expressions may reference
+_PIPELINE_STAGES = {
+    "map": (functions.map_list, ("item",)),
+    "filter": (functions.filter_list, ("item",)),
+    "reduce": (functions.reduce_list, ("acc", "item")),
+}
+
+
+def _compile_pipeline(parsed: list, call: Callable, expression: str):
+    """Fuse nested map/filter calls, optionally ending in reduce, into one loop.
+
+    Handles chains such as ``reduce("$acc + $item", filter("$item > 10",
+    map("$item * 2", $nums)))`` where every stage expression is a single
+    operation _binary_operation() accepts and the innermost list and the reduce
+    initial value are plain tokens. The generated loop passes each item through
+    all stages without building the intermediate lists. Returns None for any
+    other call; at runtime the unfused call runs instead whenever a stage name
+    no longer resolves to its builtin or the loop raises.
+    """
+    stages = []
+    initial = None
+    node = parsed
+    while type(node) is CallNode and len(node) > 1 and node[0] in _PIPELINE_STAGES:
+        name, stage_expression, *rest = node[0], *node[1:]
+        if name == "reduce":
+            if stages or len(rest) not in (1, 2):
+                return None
+            if len(rest) == 2:
+                initial = rest[1]
+                if not isinstance(initial, Token):
+                    return None
+        elif len(rest) != 1:
+            return None
+        if not (
+            isinstance(stage_expression, Token) and stage_expression.type == "STRING"
+        ):
+            return None
+        stages.append((name, stage_expression.value))
+        node = rest[0]
+    if len(stages) < 2 or not isinstance(node, Token):
+        return None
+
+    namespace = {}
+
+    def operand(value):
+        is_reference, key = value
+        if is_reference:
+            return key
+        name = f"c{len(namespace)}"
+        namespace[name] = key
+        return name
+
+    lines = ["def kernel(items, acc):"]
+    if stages[0][0] == "reduce":
+        lines.append("    have = acc is not None")
+    else:
+        lines.append("    acc = []")
+    lines.append("    for item in items:")
+    for name, stage_expression in reversed(stages):
+        operation = _binary_operation(stage_expression)
+        if operation is None:
+            return None
+        apply, left, right = operation
+        keys = _PIPELINE_STAGES[name][1]
+        if any(value[0] and value[1] not in keys for value in (left, right)):
+            return None
+        applied = f"{operand((False, apply))}({operand(left)}, {operand(right)})"
+        if name == "map":
+            lines.append(f"        item = {applied}")
+        elif name == "filter":
+            lines.append(f"        if not {applied}:")
+            lines.append("            continue")
+        else:
+            lines.append("        if not have:")
+            lines.append("            acc, have = item, True")
+            lines.append("            continue")
+            lines.append(f"        acc = {applied}")
+    if stages[0][0] != "reduce":
+        lines.append("        acc.append(item)")
+    lines.append("    return acc")
+    exec(compile("\n".join(lines), "<drl>", "exec"), namespace)
+    kernel = namespace["kernel"]
+
+    builtins = [(name, _PIPELINE_STAGES[name][0]) for name, _ in stages]
+    source = _compile_token(node, expression)
+    initial = None if initial is None else _compile_token(initial, expression)
+
+    def pipeline(context, config):
+        for name, builtin in builtins:
+            if (
+                name in config.custom_functions
+                or functions.FUNCTIONS.get(name) is not builtin
+            ):
+                return call(context, config)
+        try:
+            return kernel(
+                source(context, config),
+                None if initial is None else initial(context, config),
+            )
+        except Exception:
+            return call(context, config)
+
+    return pipeline
+
+
+def _is_prebound(parsed, config: DRLConfig) -> bool:
+    """Check if a call node can use the callable bound to it at parse time."""
+    return (
+        isinstance(parsed, _PatternCall)
+        and parsed[0] not in config.custom_functions
+        and functions.FUNCTIONS.get(parsed[0]) is parsed.builtin
+    )
+
+
+def _raise_argument_error(func_name: str, error: Exception, expression: str):
+    """Re-raise an error from evaluating a function argument as a DRL error."""
+    # Re-raise DRL errors as-is
+    if isinstance(error, DRLError):
+        raise error
+    # Wrap other errors
+    raise DRLTypeError(
+        f"Error evaluating argument for function '{func_name}': {str(error)}",
+        expression,
+        -1,
+        f"Function: {func_name}",
+    )
+
+
+def _call_function(
+    parsed, args: list, prebound: bool, config: DRLConfig, expression: str
+) -> Any:
+    """Call the function of a call node with already evaluated arguments."""
+    func_name = parsed[0]
+    # Use the execute function from functions module to handle function calls
+    # This uses the FUNCTIONS registry and handles type conversion
+    # Pass config to access custom functions
     try:
-        parsed = parse_line(line, config)
-        return evaluate(parsed, context, config, line)
+        if prebound:
+            return parsed.bound(*args)
+        return functions.execute(func_name, *args, config=config)
+    except Exception as e:
+        _raise_call_error(func_name, e, args, expression)
+
+
+def _raise_call_error(func_name: str, error: Exception, args: list, expression: str):
+    """Re-raise an error from calling a function as a DRL error."""
+    if isinstance(error, NameError):
+        raise DRLNameError(
+            str(error),
+            expression,
+            -1,
+            f"Function '{func_name}' is not defined. Check spelling or register as custom function.",
+        )
+    # Re-raise DRL errors as-is
+    if isinstance(error, DRLError):
+        raise error
+    raise DRLTypeError(
+        f"Error executing function '{func_name}': {str(error)}",
+        expression,
+        -1,
+        f"Function: {func_name}, Arguments: {args}",
+    )
+
+
+def interpret(
+    line: str, context: Dict[str, Any], config: Optional[DRLConfig] = None
+) -> Any:
+    """Interpret a DRL expression against a context dictionary.
+
+    Args:
+        line: The DRL expression string
+        context: The data dictionary to resolve references from
+        config: Optional DRLConfig for custom syntax symbols (ref_indicator, key_delimiter)
+
+    Returns:
+        The result of evaluating the expression
+
+    Raises:
+        DRLSyntaxError: For syntax errors in the expression
+        DRLReferenceError: If a reference path cannot be resolved
+        DRLNameError: If a function is not found
+        DRLTypeError: For type-related errors
+
+    Examples:
+        >>> interpret('$root>timestamp', {'root': {'timestamp': 1234}})
+        1234
+        >>> interpret('split($data>names, ",")', {'data': {'names': 'a,b,c'}})
+        ['a', 'b', 'c']
+        >>> interpret('2 + 3 * 4', {})
+        14
+        >>> interpret('$value * 2 + 10', {'value': 5})
+        20
+        >>> # Using custom symbols
+        >>> interpret('@root.timestamp', {'root': {'timestamp': 1234}}, DRLConfig('@', '.'))
+        1234
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    compiled = _with_drl_errors(
+        line, _compile_cached, line, config.ref_indicator, config.key_delimiter
+    )
+    return _with_drl_errors(line, compiled, context, config)
+
+
+def interpret_batch(
+    line: str, contexts: List[Dict[str, Any]], config: Optional[DRLConfig] = None
+) -> List[Any]:
+    """Interpret one DRL expression against each of several context dictionaries.
+
+    The expression is tokenized and parsed once and the result is evaluated
+    against every context, which avoids re-parsing when the same expression is
+    applied to many records.
+
+    Args:
+        line: The DRL expression string
+        contexts: The data dictionaries to resolve references from
+        config: Optional DRLConfig for custom syntax symbols (ref_indicator, key_delimiter)
+
+    Returns:
+        List with the result of evaluating the expression against each context
+
+    Raises:
+        DRLSyntaxError: For syntax errors in the expression
+        DRLReferenceError: If a reference path cannot be resolved
+        DRLNameError: If a function is not found
+        DRLTypeError: For type-related errors
+
+    Examples:
+        >>> interpret_batch('$price * 2', [{'price': 1}, {'price': 5}])
+        [2, 10]
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    compiled = _with_drl_errors(
+        line, _compile_cached, line, config.ref_indicator, config.key_delimiter
+    )
+    return [_with_drl_errors(line, compiled, context, config) for context in contexts]
+
+
+def compile_expression(
+    line: str, config: Optional[DRLConfig] = None
+) -> Callable[[Dict[str, Any]], Any]:
+    """Prepare a DRL expression once for evaluation against many contexts.
+
+    Calling the returned function gives the same result as
+    ``interpret(line, context, config)`` without looking the expression up
+    again, which suits loops that evaluate one expression per record.
+
+    Args:
+        line: The DRL expression string
+        config: Optional DRLConfig for custom syntax symbols (ref_indicator, key_delimiter)
+
+    Returns:
+        A function taking a context dictionary and returning the result
+
+    Raises:
+        DRLSyntaxError: For syntax errors in the expression
+
+    Examples:
+        >>> double = compile_expression('$x * 2')
+        >>> [double({'x': x}) for x in (1, 2, 3)]
+        [2, 4, 6]
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+
+    compiled = _with_drl_errors(
+        line, _compile_cached, line, config.ref_indicator, config.key_delimiter
+    )
+    return lambda context: _with_drl_errors(line, compiled, context, config)
+
+
+@lru_cache(maxsize=256)
+def _binary_operation(line: str) -> Optional[tuple]:
+    """Describe line if it is a single arithmetic or comparison operation.
+
+    Returns ``(apply, left, right)`` where apply is the operator function and
+    each operand is ``(True, key)`` for a top-level reference ``$key`` or
+    ``(False, value)`` for a literal, so callers can apply the operation to
+    whole lists at once. Returns None for anything else, including syntax
+    errors and division or modulo that could hit a zero divisor, which the
+    DRL operators reject where Python may not.
+    """
+    try:
+        parsed = parse_line(line)
+    except DRLError:
+        return None
+    if type(parsed) not in (OpNode, CmpNode) or len(parsed) != 4:
+        return None
+    apply = _ARITHMETIC_OPERATORS.get(parsed[1]) or _COMPARISON_OPERATORS.get(parsed[1])
+    if apply is None:
+        return None
+
+    operands = []
+    for operand in parsed[2:]:
+        if not isinstance(operand, Token):
+            return None
+        if operand.type == "REFERENCE":
+            if operand.path is None or len(operand.path) != 1:
+                return None
+            operands.append((True, operand.path[0]))
+            continue
+        constant = _compile_token(operand, line)
+        if not hasattr(constant, "value"):
+            return None
+        operands.append((False, constant.value))
+
+    left, right = operands
+    if type(parsed) is OpNode and parsed[1] in _ZERO_DIVISOR_ERRORS:
+        if right[0] or type(right[1]) not in (int, float) or right[1] == 0:
+            return None
+    return apply, left, right
+
+
+@lru_cache(maxsize=1024)
+def _compile_cached(line: str, ref_indicator: str, key_delimiter: str) -> Callable:
+    """Parse and compile line with the given syntax symbols, reusing earlier work.
+
+    Parsing depends only on the expression and the syntax symbols, so custom
+    functions and other config settings are not part of the cache key.
+    """
+    return compile_expr(parse_line(line, DRLConfig(ref_indicator, key_delimiter)), line)
+
+
+def _with_drl_errors(line: str, func: Callable, *args: Any) -> Any:
+    """Call func(*args), converting non-DRL exceptions into DRL errors for line."""
+    try:
+        return func(*args)
     except DRLError:
         # Re-raise DRL errors as-is (they already have context)
         raise
@@ -1210,6 +2490,181 @@ def interpolate_list(
     return results
 
 
+def compile_dict(
+    templates: Dict[str, Any], config: Optional[DRLConfig] = None
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Prepare a dictionary of templates once for rendering against many contexts.
+
+    Every template string is scanned up front, so calling the returned function
+    only resolves references and evaluates expression blocks. Rendering
+    ``compile_dict(templates, config)(context)`` gives the same result as
+    ``interpolate_dict(templates, context, config)``.
+
+    Args:
+        templates: A dictionary mapping keys to template strings or nested dictionaries/lists
+        config: Optional DRLConfig for custom syntax symbols (includes drop_empty flag)
+
+    Returns:
+        A function taking a context dictionary and returning the interpolated dictionary
+
+    Examples:
+        >>> render = compile_dict({'greeting': 'Hello $name!'})
+        >>> [render(user) for user in [{'name': 'Alice'}, {'name': 'Bob'}]]
+        [{'greeting': 'Hello Alice!'}, {'greeting': 'Hello Bob!'}]
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+    return _compile_template_value(templates, config)
+
+
+def _compile_template_value(template: Any, config: DRLConfig) -> Callable:
+    """Build a renderer for a template string or a nested dictionary/list of them."""
+    if type(template) is str:
+        return _compile_template(template, config)
+
+    if type(template) is dict:
+        items = [
+            (key, _compile_template_value(value, config))
+            for key, value in template.items()
+        ]
+
+        def render_dict(context):
+            results = {}
+            for key, render in items:
+                value = render(context)
+                if not config.drop_empty or (value is not None and value != ""):
+                    results[key] = value
+            return results
+
+        return render_dict
+
+    if type(template) is list:
+        renderers = [_compile_template_value(value, config) for value in template]
+
+        def render_list(context):
+            results = []
+            for render in renderers:
+                value = render(context)
+                if not config.drop_empty or (value is not None and value != ""):
+                    results.append(value)
+            return results
+
+        return render_list
+
+    return lambda context: template
+
+
+def _compile_template(template: str, config: DRLConfig) -> Callable:
+    """Build a renderer for one template string.
+
+    Renders like _render_template() with the template's plan, but each
+    reference has its path split and each expression block is compiled once
+    here instead of on every render.
+    """
+    segments, single = _template_plan(
+        template, config.ref_indicator, config.key_delimiter
+    )
+    parts = [
+        (
+            (segment[0], segment[1])
+            if segment[0] in ("text", "same")
+            else ("value", _compile_segment(template, segment, config))
+        )
+        for segment in segments
+    ]
+
+    if single and len(parts) == 1:
+        resolve = parts[0][1]
+
+        def render_single(context):
+            # Type preservation: None still becomes an empty string
+            value = resolve(context)
+            return "" if value is None else value
+
+        return render_single
+
+    def render(context):
+        result = []
+        for kind, part in parts:
+            if kind == "text":
+                result.append(part)
+                continue
+            if kind == "same":
+                result.append(result[part])
+                continue
+            value = part(context)
+            if single:
+                return "" if value is None else value
+            result.append(str(value) if value is not None else "")
+        return "".join(result)
+
+    return render
+
+
+def _compile_segment(template: str, segment: tuple, config: DRLConfig) -> Callable:
+    """Build a function of the context for a ref, expr or error template segment."""
+    kind = segment[0]
+    if kind == "ref":
+        _, ref_path, behavior, original_ref, start_pos = segment
+        if config.ref_indicator in ref_path:
+            # Nested references change the path, so it is resolved each time
+            return lambda context: resolve_reference(
+                ref_path, context, config, template, start_pos, behavior, original_ref
+            )
+        path = tuple(
+            sys.intern(part.strip()) for part in ref_path.split(config.key_delimiter)
+        )
+        if behavior != "required":
+            # Absent optional fields are common, so check the top-level key
+            # before walking the path
+            head = path[0]
+            missing = None if behavior == "optional" else original_ref
+
+            def optional_reference(context):
+                if type(context) is dict and head not in context:
+                    return missing
+                return _resolve_path(
+                    path, context, config, template, start_pos, behavior, original_ref
+                )
+
+            return optional_reference
+        return lambda context: _resolve_path(
+            path, context, config, template, start_pos, behavior, original_ref
+        )
+
+    if kind == "expr":
+        _, expr, _, start_pos = segment
+        try:
+            compiled = _compile_cached(expr, config.ref_indicator, config.key_delimiter)
+        except Exception:
+            # Leave syntax errors to interpret() so they surface when rendered
+            compiled = None
+
+        def expression_block(context):
+            try:
+                if compiled is None:
+                    return interpret(expr, context, config)
+                return _with_drl_errors(expr, compiled, context, config)
+            except DRLError:
+                raise
+            except Exception as e:
+                raise DRLError(
+                    f"Error evaluating expression: {str(e)}",
+                    template,
+                    start_pos,
+                    f"Expression: {expr}",
+                )
+
+        return expression_block
+
+    _, message, position, error_context = segment
+
+    def syntax_error(context):
+        raise DRLSyntaxError(message, template, position, error_context)
+
+    return syntax_error
+
+
 def interpolate(
     template: str, context: Dict[str, Any], config: Optional[DRLConfig] = None
 ) -> Any:
@@ -1262,8 +2717,28 @@ def interpolate(
     if config is None:
         config = DEFAULT_CONFIG
 
-    ref_indicator = config.ref_indicator
-    result = []
+    return _render_template(
+        template,
+        _template_plan(template, config.ref_indicator, config.key_delimiter),
+        context,
+        config,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _template_plan(template: str, ref_indicator: str, key_delimiter: str) -> tuple:
+    """Split a template into the segments interpolate renders, reusing earlier work.
+
+    Returns ``(segments, single)``. Each segment is ``("text", text)``,
+    ``("ref", path, behavior, original_ref, position)``, ``("same", index)``
+    for a reference already rendered at index,
+    ``("expr", expression, preserve_type, position)`` or
+    ``("error", message, position, context)`` for a syntax error that is raised
+    once the segments before it have been rendered. ``single`` is True when
+    the template is one type-preserving reference or expression block.
+    """
+    segments = []
+    text = []
     i = 0
     template_len = len(template)
 
@@ -1272,9 +2747,12 @@ def interpolate(
     has_literal_text = False
     has_string_expression_block = False
     reference_count = 0
-    single_ref_value = None  # Store the value if it's a single reference
     type_preserving_expr_count = 0
-    type_preserving_expr_value = None
+
+    def flush_text():
+        if text:
+            segments.append(("text", "".join(text)))
+            text.clear()
 
     while i < template_len:
         # Check for {% expression %} block
@@ -1308,35 +2786,27 @@ def interpolate(
                 else:
                     i += 1
 
+            flush_text()
             if depth != 0:
-                raise DRLSyntaxError(
-                    "Unterminated expression block: expected closing '%}'",
-                    template,
-                    start_pos,
-                    "Expression block started with '{%' but never closed",
+                segments.append(
+                    (
+                        "error",
+                        "Unterminated expression block: expected closing '%}'",
+                        start_pos,
+                        "Expression block started with '{%' but never closed",
+                    )
                 )
+                return tuple(segments), False
 
-            # Extract and evaluate the expression
+            # Extract the expression
             expr = template[expr_start:i].rstrip()
             i += 2  # Skip %}
 
-            try:
-                value = interpret(expr, context, config)
-                if preserve_type:
-                    type_preserving_expr_count += 1
-                    type_preserving_expr_value = value
-                else:
-                    has_string_expression_block = True
-                result.append(str(value) if value is not None else "")
-            except DRLError:
-                raise
-            except Exception as e:
-                raise DRLError(
-                    f"Error evaluating expression: {str(e)}",
-                    template,
-                    start_pos,
-                    f"Expression: {expr}",
-                )
+            if preserve_type:
+                type_preserving_expr_count += 1
+            else:
+                has_string_expression_block = True
+            segments.append(("expr", expr, preserve_type, start_pos))
             continue
 
         # Check for reference indicator (e.g., $ref>path)
@@ -1384,18 +2854,21 @@ def interpolate(
                     i += 1
 
                 if depth > 0:
-                    raise DRLSyntaxError(
-                        f"Unterminated reference: expected closing '{closing_delimiter}'",
-                        template,
-                        start_pos,
-                        f"Reference started at position {start_pos} but never closed",
+                    flush_text()
+                    segments.append(
+                        (
+                            "error",
+                            f"Unterminated reference: expected closing '{closing_delimiter}'",
+                            start_pos,
+                            f"Reference started at position {start_pos} but never closed",
+                        )
                     )
+                    return tuple(segments), False
                 i += 1  # Skip closing delimiter
             else:
                 # Collect reference path until stop characters
                 # For bare references in templates, stop at common delimiters
                 # Use bracketed syntax $(path) for paths containing spaces/special chars
-                key_delimiter = config.key_delimiter
                 # Stop at whitespace, quotes, braces (for {% %}), common punctuation, and path separators
                 stop_chars = " \t\n\r\"'{}(),;!?/"
                 stop_chars += ref_indicator  # Stop at next reference
@@ -1428,55 +2901,105 @@ def interpolate(
                 else:
                     original_ref = f"{ref_indicator}{ref_path}"
 
-                try:
-                    value = resolve_reference(
-                        ref_path,
-                        context,
-                        config,
-                        template,
-                        start_pos,
-                        behavior,
-                        original_ref,
-                    )
-                    reference_count += 1
-                    single_ref_value = value  # Store for potential type preservation
-                    result.append(str(value) if value is not None else "")
-                except DRLError:
-                    raise
+                flush_text()
+                reference_count += 1
+                segments.append(("ref", ref_path, behavior, original_ref, start_pos))
             else:
                 # Empty reference - just include the indicator as literal
-                result.append(ref_indicator)
+                text.append(ref_indicator)
                 has_literal_text = True
             continue
 
         # Regular character - add as literal
         has_literal_text = True
-        result.append(template[i])
+        text.append(template[i])
         i += 1
 
-    string_result = "".join(result)
+    flush_text()
+    # A single type-preserving expression block, or a single reference with no
+    # literals or expression blocks, returns the original value type
+    single = not has_literal_text and (
+        (
+            type_preserving_expr_count == 1
+            and reference_count == 0
+            and not has_string_expression_block
+        )
+        or (
+            reference_count == 1
+            and not has_string_expression_block
+            and type_preserving_expr_count == 0
+        )
+    )
+    if type_preserving_expr_count == 0 and not has_string_expression_block:
+        segments = _share_repeated_references(segments)
+    return tuple(segments), single
 
-    # Type preservation for a single type-preserving expression block
-    if (
-        type_preserving_expr_count == 1
-        and not has_literal_text
-        and reference_count == 0
-        and not has_string_expression_block
-    ):
-        if type_preserving_expr_value is None:
-            return ""
-        return type_preserving_expr_value
 
-    # Type preservation: if template was just a single reference with no literals
-    # or expression blocks, return the original value type (except None -> "")
-    if (
-        reference_count == 1
-        and not has_literal_text
-        and not has_string_expression_block
-        and type_preserving_expr_count == 0
-    ):
-        if single_ref_value is None:
-            return ""
-        return single_ref_value
+def _share_repeated_references(segments: list) -> list:
+    """Replace repeats of a reference segment by ``("same", index)``.
+
+    Without expression blocks rendering only reads the context, so a
+    reference seen earlier in the template renders to the same text as the
+    segment at index and need not be resolved again.
+    """
+    first = {}
+    shared = []
+    for index, segment in enumerate(segments):
+        if segment[0] == "ref":
+            key = segment[1:3]
+            if key in first:
+                segment = ("same", first[key])
+            else:
+                first[key] = index
+        shared.append(segment)
+    return shared
+
+
+def _render_template(
+    template: str, plan: tuple, context: Dict[str, Any], config: DRLConfig
+) -> Any:
+    """Render the segments from _template_plan against a context."""
+    segments, single = plan
+    result = []
+    for segment in segments:
+        kind = segment[0]
+        if kind == "text":
+            result.append(segment[1])
+            continue
+        if kind == "same":
+            result.append(result[segment[1]])
+            continue
+        if kind == "ref":
+            _, ref_path, behavior, original_ref, start_pos = segment
+            value = resolve_reference(
+                ref_path,
+                context,
+                config,
+                template,
+                start_pos,
+                behavior,
+                original_ref,
+            )
+        elif kind == "expr":
+            _, expr, _, start_pos = segment
+            try:
+                value = interpret(expr, context, config)
+            except DRLError:
+                raise
+            except Exception as e:
+                raise DRLError(
+                    f"Error evaluating expression: {str(e)}",
+                    template,
+                    start_pos,
+                    f"Expression: {expr}",
+                )
+        else:
+            _, message, position, error_context = segment
+            raise DRLSyntaxError(message, template, position, error_context)
+
+        if single:
+            # Type preservation: None still becomes an empty string
+            return "" if value is None else value
+        result.append(str(value) if value is not None else "")
 
-    return string_result
+    return "".join(result)
@@ -229,6 +229,46 @@ class TestCustomFunctions:
         if "quadruple" in FUNCTIONS:
             del FUNCTIONS["quadruple"]
 
+    def test_register_unhashable_callable(self):
+        """Test callables defining __eq__ without __hash__ can be registered."""
+
+        class Doubler:
+            def __eq__(self, other):
+                return isinstance(other, Doubler)
+
+            def __call__(self, x: int):
+                return x * 2
+
+        register_function("dbl", Doubler())
+        try:
+            assert interpret("dbl(3)", {}) == 6
+            assert interpret("dbl('4')", {}) == 8
+        finally:
+            from drlang.functions import FUNCTIONS
+
+            del FUNCTIONS["dbl"]
+
+    def test_register_pure_function_caches_results(self):
+        """Pure functions are called once per distinct argument tuple."""
+        calls = []
+
+        def slow_square(x: int):
+            calls.append(x)
+            return x * x
+
+        config = register_function("slow_square", slow_square, DRLConfig(), pure=True)
+
+        assert interpret("slow_square($n)", {"n": 4}, config) == 16
+        assert interpret("slow_square($n)", {"n": 4}, config) == 16
+        # Type hints still drive argument conversion
+        assert interpret('slow_square("5")', {}, config) == 25
+        assert calls == [4, 5]
+
+    def test_register_pure_function_unhashable_arguments(self):
+        """Unhashable arguments bypass the cache."""
+        config = register_function("total", lambda xs: sum(xs), DRLConfig(), pure=True)
+        assert interpret("total($xs)", {"xs": [1, 2, 3]}, config) == 6
+
 
 class TestRealWorldCustomFunctions:
     """Test real-world use cases for custom functions."""
@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: MIT
 # import pytest
-from drlang.functions import print_value, execute
+from drlang.functions import print_value, execute, convert_arg_types
 
 
 class TestSplitFunction:
@@ -33,6 +33,20 @@ class TestSplitFunction:
         assert result == ["one", "two", "three"]
 
 
+class TestContainsAnyFunction:
+    """Test the contains_any function."""
+
+    def test_contains_any_match(self):
+        assert execute("contains_any", ["FATAL", "ERROR"], "ERROR: disk full") is True
+
+    def test_contains_any_no_match(self):
+        assert execute("contains_any", ["FATAL", "ERROR"], "INFO: ok") is False
+
+    def test_contains_any_empty(self):
+        assert execute("contains_any", [], "anything") is False
+        assert execute("contains_any", [""], "") is True
+
+
 class TestPrintFunction:
     """Test the print function."""
 
@@ -60,3 +74,53 @@ class TestPrintFunction:
     def test_print_returns_none(self):
         result = print_value("test")
         assert result is None
+
+
+class TestConvertArgTypes:
+    """Test argument type conversion."""
+
+    def test_converts_to_annotated_type(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        assert convert_arg_types(add, "1", 2) == [1, 2]
+        # Second call is served from the signature cache
+        assert convert_arg_types(add, "3", "4") == [3, 4]
+
+    def test_builtin_passthrough(self):
+        assert convert_arg_types(max, "1", 2) == ("1", 2)
+
+    def test_unchanged_args_returned_as_is(self):
+        def greet(name: str, times: int) -> str:
+            return name * times
+
+        args = ("hi", 2)
+        assert convert_arg_types(greet, *args) == args
+
+    def test_unhashable_callable(self):
+        class Doubler:
+            __hash__ = None
+
+            def __call__(self, x: int) -> int:
+                return x * 2
+
+        assert convert_arg_types(Doubler(), "5") == [5]
+
+    def test_no_convert_builtins_pass_through(self):
+        from drlang.functions import _NO_CONVERT
+
+        for func in _NO_CONVERT:
+            assert convert_arg_types(func, "1", 2, "x") == ("1", 2, "x")
+
+    def test_no_convert_learned_on_first_call(self):
+        from drlang.functions import _NO_CONVERT, FUNCTIONS, execute
+
+        assert execute("randint", 1, 1) == 1
+        assert FUNCTIONS["randint"] in _NO_CONVERT
+        assert FUNCTIONS["list_get"] not in _NO_CONVERT
+
+    def test_string_annotations_resolved(self):
+        def scale(x: "int", factor: "float") -> "float":
+            return x * factor
+
+        assert convert_arg_types(scale, "2", "1.5") == [2, 1.5]
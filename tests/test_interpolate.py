@@ -7,9 +7,11 @@ import pytest
 from drlang import (
     interpolate,
     interpolate_dict,
+    compile_dict,
     DRLConfig,
     DRLSyntaxError,
     DRLReferenceError,
+    DRLTypeError,
 )
 
 
@@ -111,6 +113,12 @@ class TestReferenceInterpolation:
         result = interpolate("$first and $second", {"first": "one", "second": "two"})
         assert result == "one and two"
 
+    def test_repeated_reference(self):
+        """A reference used more than once renders the same value each time."""
+        context = {"sel": "a", "items": {"a": "Apple"}}
+        result = interpolate("$(items>$(sel)) / $(items>$(sel)) / $sel", context)
+        assert result == "Apple / Apple / a"
+
     def test_reference_with_brackets_required(self):
         """Required reference with () brackets."""
         result = interpolate("Value: $(value)", {"value": 42})
@@ -665,3 +673,56 @@ class TestInterpolateDictRealWorld:
         assert result["welcome"]["subject"] == "Welcome Bob!"
         assert "Hello Bob" in result["welcome"]["body"]
         assert "5 new notifications" in result["notification"]["body"]
+
+
+class TestCompileDict:
+    """Test compiling template dictionaries for reuse across contexts."""
+
+    def test_matches_interpolate_dict(self):
+        """Rendering a compiled dict gives the same result as interpolate_dict."""
+        templates = {
+            "greeting": "Hello $user>name!",
+            "count": "{%= $count * 2 %}",
+            "nested": {"email": "$[user>email]", "tags": ["$user>name", 3]},
+        }
+        render = compile_dict(templates)
+        for context in [
+            {"user": {"name": "Alice", "email": "a@example.com"}, "count": 1},
+            {"user": {"name": "Bob"}, "count": 4},
+        ]:
+            assert render(context) == interpolate_dict(templates, context)
+
+    def test_drop_empty(self):
+        """drop_empty from the compile-time config applies to every render."""
+        render = compile_dict(
+            {"name": "$name", "phone": "$[phone]"}, DRLConfig(drop_empty=True)
+        )
+        assert render({"name": "Alice"}) == {"name": "Alice"}
+        assert render({"name": "Bob", "phone": "555"}) == {
+            "name": "Bob",
+            "phone": "555",
+        }
+
+    def test_syntax_error_raised_on_render(self):
+        """Malformed templates raise when rendered, like interpolate_dict."""
+        render = compile_dict({"bad": "Value: {% $x"})
+        with pytest.raises(DRLSyntaxError):
+            render({"x": 1})
+
+    def test_nested_references_and_expression_errors(self):
+        """Nested reference paths follow the context; bad blocks raise on render."""
+        render = compile_dict({"color": "$(rocks>$(best))", "ratio": "{% $a / $b %}"})
+        context = {"rocks": {"granite": "grey"}, "best": "granite", "a": 1, "b": 2}
+        assert render(context) == {"color": "grey", "ratio": "0.5"}
+        context["best"] = "missing"
+        with pytest.raises(DRLReferenceError):
+            render(context)
+        with pytest.raises(DRLTypeError, match="Division by zero"):
+            render({"rocks": {"x": 1}, "best": "x", "a": 1, "b": 0})
+
+    def test_absent_optional_fields(self):
+        """Optional and passthrough references to absent keys render like interpolate_dict."""
+        templates = {"phone": "$[user>phone]", "fax": "${fax>number}", "id": "$id"}
+        render = compile_dict(templates, DRLConfig(drop_empty=True))
+        assert render({"id": 1}) == {"fax": "${fax>number}", "id": 1}
+        assert render({"id": 2, "user": {"phone": "555"}})["phone"] == "555"
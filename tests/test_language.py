@@ -7,9 +7,14 @@ from drlang.language import (
     resolve_reference,
     parse_line,
     interpret,
+    interpret_batch,
+    compile_expr,
+    compile_expression,
+    evaluate,
     Token,
+    DEFAULT_CONFIG,
 )
-from drlang import DRLReferenceError, DRLTypeError, DRLNameError
+from drlang import DRLReferenceError, DRLTypeError, DRLNameError, DRLSyntaxError
 
 
 class TestTokenize:
@@ -27,6 +32,12 @@ class TestTokenize:
         assert tokens[0].type == "REFERENCE"
         assert tokens[0].value == "houses>Maryland City>occupants"
 
+    def test_tokenize_reference_path_split(self):
+        tokens = tokenize("$(rocks > best) + $(rocks>$(records>best)>color)")
+        assert tokens[0].path == ("rocks", "best")
+        # Nested references are resolved at evaluation time
+        assert tokens[2].path is None
+
     def test_tokenize_function_call(self):
         tokens = tokenize("print($root>timestamp)")
         assert len(tokens) == 4
@@ -59,6 +70,53 @@ class TestTokenize:
         tokens = tokenize("")
         assert len(tokens) == 0
 
+    def test_tokenize_mixed_fast_and_fallback_tokens(self):
+        tokens = tokenize("café(1.5, 'it\\'s') >= $x and not True ")
+        assert [(t.type, t.value) for t in tokens] == [
+            ("FUNCTION", "café"),
+            ("LPAREN", "("),
+            ("NUMBER", "1.5"),
+            ("COMMA", ","),
+            ("STRING", "it's"),
+            ("RPAREN", ")"),
+            ("COMPARISON", ">="),
+            ("REFERENCE", "x"),
+            ("LOGICAL", "and"),
+            ("NOT", "not"),
+            ("BOOLEAN", "True"),
+        ]
+
+    def test_tokenize_number_values(self):
+        tokens = tokenize("7 + 2.5 * 10")
+        assert [t.numeric for t in tokens[::2]] == [7, 2.5, 10]
+        assert isinstance(tokens[0].numeric, int)
+
+    def test_tokenize_shares_position_independent_tokens(self):
+        first = tokenize("1 + (2) and x")
+        second = tokenize("1 + (2) and x")
+        # Numbers, operators, delimiters and keywords are reused; names are not
+        assert all(a is b for a, b in zip(first[:-1], second[:-1]))
+        assert first[-1] is not second[-1]
+        assert tokenize("12345")[0] is not tokenize("12345")[0]
+
+    def test_tokenize_shared_tokens_are_read_only(self):
+        tokens = tokenize("1 + 2")
+        with pytest.raises(AttributeError):
+            tokens[1].value = "-"
+        with pytest.raises(AttributeError):
+            tokens[0].numeric = 4
+        assert interpret("5 + 1", {}) == 6
+
+    def test_tokenize_custom_ref_indicator_not_scanned_as_operator(self):
+        from drlang import DRLConfig
+
+        tokens = tokenize("+a > 1", DRLConfig(ref_indicator="+"))
+        assert [(t.type, t.value) for t in tokens] == [
+            ("REFERENCE", "a"),
+            ("COMPARISON", ">"),
+            ("NUMBER", "1"),
+        ]
+
 
 class TestResolveReference:
     """Test reference resolution."""
@@ -83,6 +141,23 @@ class TestResolveReference:
         result = resolve_reference("houses>Maryland City>occupants", context)
         assert result == "John,Jane"
 
+    def test_resolve_dict_subclass_checks_keys(self):
+        from collections import defaultdict
+
+        context = {"root": defaultdict(int, {"a": 1})}
+        assert resolve_reference("root>a", context) == 1
+        with pytest.raises(DRLReferenceError):
+            resolve_reference("root>missing", context)
+
+    def test_resolve_read_only_mapping(self):
+        from types import MappingProxyType
+
+        context = MappingProxyType({"root": MappingProxyType({"a": [1, 2]})})
+        assert resolve_reference("root>a>1", context) == 2
+        assert interpret("$root>a>0 + 1", context) == 2
+        with pytest.raises(DRLReferenceError):
+            resolve_reference("root>missing", context)
+
     def test_resolve_missing_key(self):
         context = {"root": {}}
         with pytest.raises(DRLReferenceError):
@@ -128,6 +203,58 @@ class TestParseLine:
         result = parse_line("")
         assert result is None
 
+    def test_parse_node_types(self):
+        from drlang.language import CallNode, CmpNode, LogicNode, NotNode, OpNode
+
+        result = parse_line("not f($a + 1) > 2 and $b")
+        assert isinstance(result, LogicNode)
+        assert isinstance(result[2], NotNode)
+        assert isinstance(result[2][1], CmpNode)
+        assert isinstance(result[2][1][2], CallNode)
+        assert isinstance(result[2][1][2][1], OpNode)
+        # Nodes keep the documented list shape
+        assert result[2][1][2][1][:2] == ["OPERATOR", "+"]
+
+    def test_evaluate_plain_tagged_lists(self):
+        parsed = [
+            "OPERATOR",
+            "*",
+            Token("NUMBER", "6"),
+            ["len", Token("STRING", "abc")],
+        ]
+        assert evaluate(parsed, {}) == 18
+
+    def test_evaluate_call_follows_registry_changes(self):
+        from drlang.functions import FUNCTIONS
+
+        parsed = parse_line("upper($s)")
+        assert evaluate(parsed, {"s": "a"}) == "A"
+        original = FUNCTIONS["upper"]
+        FUNCTIONS["upper"] = lambda s: s * 2
+        try:
+            assert evaluate(parsed, {"s": "a"}) == "aa"
+        finally:
+            FUNCTIONS["upper"] = original
+        assert evaluate(parsed, {"s": "b"}) == "B"
+
+    def test_parse_folds_constant_arithmetic(self):
+        result = parse_line("2 + 3 * 4")
+        assert isinstance(result, Token)
+        assert result.type == "NUMBER"
+        assert result.value == "14"
+
+    def test_parse_folds_constant_subexpression(self):
+        result = parse_line("$x + (1 < 2)")
+        assert result[0] == "OPERATOR"
+        assert result[3].type == "BOOLEAN"
+        assert result[3].value == "True"
+
+    def test_parse_does_not_fold_errors(self):
+        result = parse_line("1 / 0")
+        assert isinstance(result, list)
+        with pytest.raises(DRLTypeError, match="Division by zero"):
+            interpret("1 / 0", {})
+
 
 class TestInterpret:
     """Test the main interpret function."""
@@ -188,6 +315,147 @@ class TestInterpret:
         result = interpret("$level1>level2>level3>level4>level5", context)
         assert result == "deep"
 
+    def test_interpret_cached_parse_respects_config(self):
+        from drlang import DRLConfig
+
+        assert interpret("$a>b", {"a": {"b": 1}}) == 1
+        assert interpret("$a>b", {"a": {"b": 2}}) == 2
+        # Same expression text, different key delimiter
+        assert interpret("$a.b", {"a.b": 3}) == 3
+        assert interpret("$a.b", {"a": {"b": 4}}, DRLConfig(key_delimiter=".")) == 4
+        # Same expression text, different custom functions
+        expr = "f(2)"
+        assert interpret(expr, {}, DRLConfig(custom_functions={"f": abs})) == 2
+        double = DRLConfig(custom_functions={"f": lambda x: x * 2})
+        assert interpret(expr, {}, double) == 4
+
+
+class TestInterpretBatch:
+    """Test evaluating one expression against many contexts."""
+
+    def test_batch_results_in_order(self):
+        contexts = [{"x": 1}, {"x": 2}, {"x": 3}]
+        assert interpret_batch("$x * 10", contexts) == [10, 20, 30]
+
+    def test_batch_empty(self):
+        assert interpret_batch("$x", []) == []
+
+    def test_batch_missing_reference(self):
+        with pytest.raises(DRLReferenceError):
+            interpret_batch("$(x)", [{"x": 1}, {}])
+
+
+class TestCompileExpression:
+    """Test preparing an expression once for many contexts."""
+
+    def test_matches_interpret(self):
+        evaluate = compile_expression("$x * 10 + len($items)")
+        for context in [{"x": 1, "items": []}, {"x": 2, "items": [1, 2]}]:
+            assert evaluate(context) == interpret("$x * 10 + len($items)", context)
+
+    def test_errors_match_interpret(self):
+        with pytest.raises(DRLSyntaxError):
+            compile_expression("max(1")
+        with pytest.raises(DRLReferenceError):
+            compile_expression("$(x)")({})
+
+
+class TestCompileExpr:
+    """Test compiling parsed expressions to closures."""
+
+    def test_compiled_matches_evaluate(self):
+        context = {"a": 5, "items": [1, 2, 3], "name": "drl"}
+        expressions = [
+            "$a * 2 + 1",
+            "($a - 1) % 3 == 1",
+            "not $a > 3 or len($items) >= 3",
+            "upper($name)",
+            "$[missing]",
+            "2 ^ 3 / 4",
+        ]
+        for expr in expressions:
+            parsed = parse_line(expr)
+            compiled = compile_expr(parsed, expr)
+            assert compiled(context, DEFAULT_CONFIG) == evaluate(
+                parsed, context, DEFAULT_CONFIG, expr
+            )
+
+    def test_compiled_reference_paths(self):
+        compiled = compile_expr(parse_line("$a>b>c"))
+        assert compiled({"a": {"b": {"c": 1}}}, DEFAULT_CONFIG) == 1
+        with pytest.raises(DRLReferenceError):
+            compiled({"a": {"b": {}}}, DEFAULT_CONFIG)
+        optional = compile_expr(parse_line("$[a>b>c]"))
+        assert optional({"a": {"b": {}}}, DEFAULT_CONFIG) is None
+        indexed = compile_expr(parse_line("$a>1>c"))
+        assert indexed({"a": [{}, {"c": 3}]}, DEFAULT_CONFIG) == 3
+
+    def test_compiled_resolves_functions_at_call_time(self):
+        from drlang import DRLConfig
+
+        compiled = compile_expr(parse_line("f(3)"))
+        assert compiled({}, DRLConfig(custom_functions={"f": abs})) == 3
+        assert compiled({}, DRLConfig(custom_functions={"f": str})) == "3"
+
+    def test_compiled_call_follows_registry_changes(self):
+        from drlang.functions import FUNCTIONS
+
+        compiled = compile_expr(parse_line("upper($s)"))
+        assert compiled({"s": "a"}, DEFAULT_CONFIG) == "A"
+        original = FUNCTIONS["upper"]
+        FUNCTIONS["upper"] = lambda s: s * 2
+        try:
+            assert compiled({"s": "a"}, DEFAULT_CONFIG) == "aa"
+            del FUNCTIONS["upper"]
+            with pytest.raises(DRLNameError):
+                compiled({"s": "a"}, DEFAULT_CONFIG)
+        finally:
+            FUNCTIONS["upper"] = original
+
+    def test_compiled_division_by_zero(self):
+        compiled = compile_expr(parse_line("$a / 0"), "$a / 0")
+        with pytest.raises(DRLTypeError, match="Division by zero"):
+            compiled({"a": 1}, DEFAULT_CONFIG)
+
+    def test_compiled_arithmetic_falls_back_for_errors(self):
+        expr = "$a>b * 2 + $l>1 / $c"
+        compiled = compile_expr(parse_line(expr), expr)
+        assert compiled({"a": {"b": 3}, "l": [1, 4], "c": 2}, DEFAULT_CONFIG) == 8.0
+        # Missing keys, zero divisors and bad operands report the usual errors
+        with pytest.raises(DRLReferenceError):
+            compiled({"a": {}, "l": [1, 4], "c": 2}, DEFAULT_CONFIG)
+        with pytest.raises(DRLTypeError, match="Division by zero"):
+            compiled({"a": {"b": 3}, "l": [1, 4], "c": 0}, DEFAULT_CONFIG)
+        with pytest.raises(TypeError):
+            compiled({"a": {"b": "x"}, "l": [1, 4], "c": 2}, DEFAULT_CONFIG)
+        # Zero divisors are rejected even where Python would not raise
+        modulo = compile_expr(parse_line("$s % $n"))
+        with pytest.raises(DRLTypeError, match="Modulo by zero"):
+            modulo({"s": "%d", "n": 0}, DEFAULT_CONFIG)
+
+    def test_compiled_logic_short_circuits(self):
+        compiled = compile_expr(parse_line("not $a > 0 or $missing > 1"))
+        assert compiled({"a": 1, "missing": 2}, DEFAULT_CONFIG) is True
+        assert compiled({"a": 0}, DEFAULT_CONFIG) is True
+        with pytest.raises(DRLReferenceError):
+            compiled({"a": 1}, DEFAULT_CONFIG)
+
+    def test_compiled_pure_call_memoized_unless_overridden(self):
+        from drlang import DRLConfig
+
+        calls = []
+
+        def fake_max(*args):
+            calls.append(args)
+            return "custom"
+
+        compiled = compile_expr(parse_line("max(1, 2) + 1"))
+        assert compiled({}, DEFAULT_CONFIG) == 3
+        assert compiled({}, DEFAULT_CONFIG) == 3
+        override = DRLConfig(custom_functions={"max": fake_max})
+        assert compile_expr(parse_line("max(1, 2)"))({}, override) == "custom"
+        assert calls == [(1, 2)]
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -261,3 +529,35 @@ class TestRealWorldScenarios:
 
         result = interpret("split($users>admin>roles, ',')", source_data)
         assert result == ["superuser", "moderator", "user"]
+
+
+class TestPackageAttributes:
+    """Test the names exported from the drlang package."""
+
+    def test_exports_resolve(self):
+        import drlang
+        from drlang import functions, language
+
+        for name in drlang.__all__:
+            module = functions if name == "register_function" else language
+            assert getattr(drlang, name) is getattr(module, name)
+            assert name in dir(drlang)
+
+    def test_unknown_attribute(self):
+        import drlang
+
+        with pytest.raises(AttributeError):
+            drlang.not_a_drlang_name
+
+    def test_submodule_attributes(self):
+        import subprocess
+        import sys
+
+        # A fresh interpreter, since the test run has already imported them
+        code = (
+            "import drlang; "
+            "assert 'if' in drlang.functions.FUNCTIONS; "
+            "assert drlang.language.interpret('1 + 1', {}) == 2; "
+            "assert callable(drlang.cli.main)"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -39,6 +39,13 @@ class TestListIndexing:
         with pytest.raises(Exception):  # DRLReferenceError
             interpret("$items>10", data)
 
+    def test_list_index_out_of_range_hint(self):
+        """Test the error names the list, not a slice of the path by index."""
+        with pytest.raises(Exception, match="List at 'arr' has length 0"):
+            interpret("$arr>0>v", {"arr": []})
+        with pytest.raises(Exception, match="List at 'lst' has length 2"):
+            interpret("$lst>9", {"lst": [1, 2]})
+
     def test_optional_list_index(self):
         """Test optional reference with list index."""
         data = {"items": [1, 2, 3]}
@@ -100,6 +107,15 @@ class TestListFunctions:
         data = {"nested": [[1, 2], [3, 4]]}
         assert interpret("list_flatten($nested)", data) == [1, 2, 3, 4]
 
+    def test_columnar(self):
+        """Test columnar function."""
+        data = {"users": [{"name": "Ann", "score": 90}, {"name": "Bob", "age": 30}]}
+        assert interpret("columnar($users)", data) == {
+            "name": ["Ann", "Bob"],
+            "score": [90, None],
+            "age": [None, 30],
+        }
+
 
 class TestMapFunction:
     """Test the map iteration function."""
@@ -137,6 +153,28 @@ class TestMapFunction:
         result = interpret("map('if($item > 2, $item * 10, $item)', $nums)", data)
         assert result == [1, 2, 30, 40]
 
+    def test_map_single_operation_errors(self):
+        """Whole-list operations still report errors like the per-item loop."""
+        from drlang import DRLError, DRLTypeError
+
+        with pytest.raises(DRLTypeError, match="Division by zero"):
+            interpret("map('10 / $item', $nums)", {"nums": [1, 0]})
+        with pytest.raises(DRLError, match="Unexpected error"):
+            interpret("map('$item + 1', $items)", {"items": [1, "a"]})
+
+    def test_map_non_iterable(self):
+        """Test map over None or a scalar still raises."""
+        from drlang import DRLTypeError
+
+        with pytest.raises(DRLTypeError, match="not iterable"):
+            interpret("map('$item', $n)", {"n": None})
+        with pytest.raises(DRLTypeError, match="not iterable"):
+            interpret("map('$item', 0)", {})
+        assert interpret("map('$item', $n)", {"n": []}) == []
+        # Reported before the (malformed) expression is parsed
+        with pytest.raises(DRLTypeError, match="not iterable"):
+            interpret("map('$item +', 5)", {})
+
 
 class TestFilterFunction:
     """Test the filter function."""
@@ -165,6 +203,23 @@ class TestFilterFunction:
         result = interpret("filter('regex_search(\"^a\", $item)', $words)", data)
         assert result == ["apple", "apricot"]
 
+    def test_filter_literal_on_left(self):
+        """Test filter with the literal as the left operand."""
+        data = {"nums": [1, 2, 3, 4, 5]}
+        result = interpret("filter('3 >= $item', $nums)", data)
+        assert result == [1, 2, 3]
+
+    def test_filter_non_iterable(self):
+        """Test filter over None or a scalar still raises."""
+        from drlang import DRLTypeError
+
+        with pytest.raises(DRLTypeError, match="not iterable"):
+            interpret("filter('$item > 1', $n)", {"n": None})
+        with pytest.raises(DRLTypeError, match="not iterable"):
+            interpret("filter('$item > 1', False)", {})
+        with pytest.raises(DRLTypeError, match="not iterable"):
+            interpret("filter('(', 5)", {})
+
 
 class TestReduceFunction:
     """Test the reduce function."""
@@ -193,6 +248,21 @@ class TestReduceFunction:
         result = interpret("reduce('$acc + $item', $words, '')", data)
         assert result == "Hello World"
 
+    def test_reduce_operator_order(self):
+        """Test reduce keeps $acc as the left operand."""
+        data = {"nums": [2, 3]}
+        result = interpret("reduce('$acc - $item', $nums, 10)", data)
+        assert result == 5
+
+    def test_reduce_non_sequence(self):
+        """Test reduce over a dict or a number raises rather than folding."""
+        from drlang import DRLTypeError
+
+        with pytest.raises(DRLTypeError):
+            interpret("reduce('$acc + $item', $d, 0)", {"d": {"a": 1}})
+        with pytest.raises(DRLTypeError, match="not subscriptable"):
+            interpret("reduce('$acc + $item', 5, 0)", {})
+
 
 class TestCombinedOperations:
     """Test combining list operations."""
@@ -237,3 +307,30 @@ class TestCombinedOperations:
         data["filtered"] = filtered
         result = interpret("sorted($filtered)", data)
         assert result == [5, 8, 9]
+
+    def test_nested_map_filter_reduce(self):
+        """Test map, filter and reduce nested in one expression."""
+        data = {"nums": [1, 4, 6, 8, 2], "words": ["a", "b"]}
+        chain = "filter('$item > 10', map('$item * 2', $nums))"
+        assert interpret(chain, data) == [12, 16]
+        assert interpret(f"reduce('$acc + $item', {chain})", data) == 28
+        assert interpret(f"reduce('$acc + $item', {chain}, 100)", data) == 128
+        assert (
+            interpret("reduce('$acc + $item', filter('$item > 99', $nums))", data)
+            is None
+        )
+        assert interpret("map('$item * 2', map('$item + $item', $words))", data) == [
+            "aaaa",
+            "bbbb",
+        ]
+
+    def test_typed_array_input(self):
+        """Test list operations accept compact typed arrays."""
+        from array import array
+
+        data = {"nums": array("q", range(1, 11))}
+        assert interpret("map('$item * 2', $nums)", data)[:3] == [2, 4, 6]
+        assert interpret("filter('$item > 8', $nums)", data) == [9, 10]
+        assert interpret("reduce('$acc + $item', $nums)", data) == 55
+        chain = "reduce('$acc + $item', filter('$item > 10', map('$item * 2', $nums)))"
+        assert interpret(chain, data) == 80
@@ -94,6 +94,23 @@ class TestLogicalOperators:
         assert interpret("(True and False) or True", {}) is True
         assert interpret("not (True and False)", {}) is True
 
+    def test_short_circuit(self):
+        """Test the right operand is only evaluated when needed."""
+        assert interpret("False and $(missing)", {}) is False
+        assert interpret("True or $(missing)", {}) is True
+        assert interpret("$x and $(missing)", {"x": 0}) == 0
+        assert interpret("$x or $(missing)", {"x": "set"}) == "set"
+
+    def test_short_circuit_skips_function_call(self):
+        """Test a skipped right operand doesn't call its functions."""
+        from drlang import DRLConfig
+
+        calls = []
+        config = DRLConfig(custom_functions={"record": lambda: calls.append(1)})
+        assert interpret("$ok or record()", {"ok": True}, config) is True
+        assert interpret("$ok and record()", {"ok": False}, config) is False
+        assert calls == []
+
 
 class TestLogicalWithComparison:
     """Test logical operators combined with comparisons."""
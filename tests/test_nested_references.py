@@ -327,6 +327,19 @@ class TestNestedReferencePerformance:
         result = interpret("$(db>$(p>t)>$(p>c))", context)
         assert result == "B"
 
+    def test_repeated_nested_lookups(self):
+        """Test that a nested path gives fresh results on each evaluation."""
+        context = {"keys": {"k1": "k2", "k2": "item"}, "data": {"item": 1, "k2": 2}}
+        expression = "$(data>$(keys>$(keys>k1)))"
+        assert interpret(expression, context) == 1
+        context["keys"]["k2"] = "k2"
+        assert interpret(expression, context) == 2
+
+    def test_nested_value_containing_reference(self):
+        """Test that a substituted value holding a reference is resolved in turn."""
+        context = {"sel": "$b", "b": "k", "a": {"k": 5}}
+        assert interpret("$(a>$(sel))", context) == 5
+
 
 class TestRealWorldNestedReferences:
     """Test real-world use cases for nested references."""
@@ -1,6 +1,7 @@
 """Tests for regex functions in DRL."""
 
 from drlang import interpret
+from drlang.functions import regex_match, regex_search, regex_split, regex_sub
 
 
 class TestRegexSearch:
@@ -274,6 +275,65 @@ class TestRegexRealWorldScenarios:
         assert "XXXX-XXXX-XXXX-XXXX" in result2
 
 
+class TestRegexSearchMany:
+    """Test regex_search_many function."""
+
+    def test_search_many(self):
+        """Test checking several patterns against one string."""
+        data = {"pwd": "Str0ng!Pass", "rules": ["[A-Z]", "\\d", "[^a-zA-Z0-9]", "x"]}
+        result = interpret("regex_search_many($rules, $pwd)", data)
+        assert result == [True, True, True, False]
+
+    def test_search_many_empty(self):
+        """Test with no patterns."""
+        assert interpret("regex_search_many($rules, 'abc')", {"rules": []}) == []
+
+
+class TestRegexExtractMany:
+    """Test regex_extract_many function."""
+
+    def test_extract_many(self):
+        """Test extracting several fields from one string."""
+        data = {
+            "request": "GET /api/users/12345?filter=active HTTP/1.1",
+            "fields": {
+                "method": "^(\\w+)\\s",
+                "user_id": "/users/(\\d+)",
+                "version": "HTTP/[\\d.]+",
+                "missing": "DELETE",
+            },
+        }
+        result = interpret("regex_extract_many($fields, $request)", data)
+        assert result == {
+            "method": "GET",
+            "user_id": "12345",
+            "version": "HTTP/1.1",
+            "missing": "",
+        }
+
+    def test_extract_many_backreference(self):
+        """Test patterns with backreferences are searched separately."""
+        data = {"fields": {"double": "(\\w)\\1", "digit": "\\d"}}
+        result = interpret("regex_extract_many($fields, 'xaab1')", data)
+        assert result == {"double": "a", "digit": "1"}
+
+    def test_extract_many_overlapping_patterns(self):
+        """Test fields whose matches overlap an earlier field's match."""
+        data = {"fields": {"word": "[a-z]+", "first": "^(\\w)"}}
+        result = interpret("regex_extract_many($fields, 'hello')", data)
+        assert result == {"word": "hello", "first": "h"}
+
+        data = {"fields": {"num": "\\d+", "digit": "(\\d)"}}
+        result = interpret("regex_extract_many($fields, 'ab 12')", data)
+        assert result == {"num": "12", "digit": "1"}
+
+    def test_extract_many_independent_fields(self):
+        """Test a field's result does not depend on the other fields."""
+        data = {"fields": {"num": "\\d+", "digit": "(\\d)", "pair": "(a)\\1"}}
+        result = interpret("regex_extract_many($fields, 'ab 12')", data)
+        assert result == {"num": "12", "digit": "1", "pair": ""}
+
+
 class TestRegexEdgeCases:
     """Test edge cases and special scenarios."""
 
@@ -303,3 +363,112 @@ class TestRegexEdgeCases:
         expr = r'regex_search("\\d+", regex_sub("[^\\w\\d]", "", "a-1-b-2"))'
         result = interpret(expr, {})
         assert result is True
+
+    def test_compiled_pattern_reused(self):
+        """Test that repeated patterns share a single compiled object."""
+        from drlang.functions import _compile
+
+        assert _compile(r"\d+") is _compile(r"\d+")
+        assert interpret(r'regex_findall("\\d+", "a1b22")', {}) == ["1", "22"]
+
+    def test_extract_group_string_coerced(self):
+        """Test that a numeric string group is coerced to an int."""
+        result = interpret(r'regex_extract("(\\w+)@(\\w+)", "user@domain", "2")', {})
+        assert result == "domain"
+
+    def test_override_builtin_regex_function(self):
+        """Test that a globally registered override bypasses the fast path."""
+        from drlang.functions import FUNCTIONS, regex_search
+
+        FUNCTIONS["regex_search"] = lambda pattern, string: "overridden"
+        try:
+            assert interpret('regex_search("a", "abc")', {}) == "overridden"
+        finally:
+            FUNCTIONS["regex_search"] = regex_search
+
+    def test_single_char_sub_matches_regex(self):
+        """Test the per-character substitution path against re.sub."""
+        import re
+
+        cases = [
+            (r"[^\d]", "", "(555) 123-4567"),
+            (r"\d", "X", "123-45-6789"),
+            (r"[,;|]", " ", "one,two;three|four"),
+            (r"(?i)[a-c]", "", "AbCdef"),
+            (r".", "-", "a\nb"),
+            (r"\d", r"<\g<0>>", "a1b2"),
+        ]
+        for pattern, replacement, string in cases:
+            expected = re.sub(pattern, replacement, string)
+            assert regex_sub(pattern, replacement, string) == expected
+
+    def test_literal_split_matches_regex(self):
+        """Test the literal separator split paths against re.split."""
+        import re
+
+        cases = [
+            (",", "apple,banana,cherry"),
+            (r"\.", "a.b..c"),
+            ("::", "one::two::three"),
+            ("[,;|]", "one,two;three|four"),
+            ("(?i)x", "aXbxc"),
+            (r"\s+", "hello   world"),
+        ]
+        for pattern, string in cases:
+            assert regex_split(pattern, string) == re.split(pattern, string)
+
+    def test_literal_fast_paths_match_regex(self):
+        """Test literal search/match/sub shortcuts against the re module."""
+        import re
+
+        strings = ["ERROR: disk full", "INFO ok", "user@example.com", "", "a|b"]
+        patterns = ["@", "ERROR|WARNING|INFO", r"\.", "a|b", r"a\|b", "INFO"]
+        for pattern in patterns:
+            for string in strings:
+                assert regex_search(pattern, string) == bool(re.search(pattern, string))
+                assert regex_match(pattern, string) == bool(re.match(pattern, string))
+                assert regex_sub(pattern, "#", string) == re.sub(pattern, "#", string)
+
+    def test_char_class_search_matches_regex(self):
+        """Test the character class membership shortcut against re.search."""
+        import re
+
+        strings = ["weak", "Better1", "Str0ng!Pass", "", "ümlaut", "x" * 300 + "!"]
+        patterns = ["[A-Z]", "[a-z]", "[^a-zA-Z0-9]", "[0-9_]", r"\d", "[^a-z]"]
+        for pattern in patterns:
+            for string in strings:
+                assert regex_search(pattern, string) == bool(re.search(pattern, string))
+
+    def test_memoized_results(self):
+        """Test repeated calls and long strings give the same results."""
+        from drlang.functions import regex_extract
+
+        for _ in range(2):
+            assert regex_search(r"\d", "abc1") is True
+            assert regex_match(r"\d", "abc1") is False
+            assert regex_extract(r"(\d+)", "id 42", group=1) == "42"
+
+        long_text = "x" * 5000 + "42"
+        assert regex_search(r"\d+$", long_text) is True
+        assert regex_extract(r"\d+", long_text) == "42"
+
+    def test_constant_pattern_bound_at_parse_time(self):
+        """Test regex calls with literal patterns give the same results when prebound."""
+        from drlang import DRLConfig
+        from drlang.functions import FUNCTIONS
+
+        data = {"s": "id-42 id-7"}
+        assert interpret(r'regex_findall("\\d+", $s)', data) == ["42", "7"]
+        assert interpret(r'regex_extract("id-(\\d+)", $s, 1)', data) == "42"
+        assert interpret('regex_split("-", "a-b")', {}) == ["a", "b"]
+        assert interpret('regex_sub("-", "_", $s)', data) == "id_42 id_7"
+
+        config = DRLConfig(custom_functions={"regex_search": lambda p, s: "custom"})
+        assert interpret('regex_search("x", "x")', {}, config) == "custom"
+
+        original = FUNCTIONS["regex_match"]
+        FUNCTIONS["regex_match"] = lambda p, s: "override"
+        try:
+            assert interpret('regex_match("x", "x")', {}) == "override"
+        finally:
+            FUNCTIONS["regex_match"] = original